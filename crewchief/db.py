@@ -1,6 +1,8 @@
 """Database repository layer for CrewChief using SQLite."""
 
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -11,6 +13,32 @@ from crewchief.models import Car, CarPart, MaintenanceEvent, MaintenanceInterval
 sqlite3.register_adapter(datetime, lambda val: val.isoformat() if val else None)
 sqlite3.register_adapter(date, lambda val: val.isoformat() if val else None)
 
+# Prepared statements are cached by SQL text, so hot queries live in module constants
+# to guarantee every call hands sqlite3 the identical string.
+_STATEMENT_CACHE_SIZE = 256
+
+_SQL_INSERT_CAR = """
+    INSERT INTO cars (
+        nickname, year, make, model, trim, vin, usage_type,
+        current_odometer, notes, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_CARS = "SELECT * FROM cars ORDER BY id"
+_SQL_SELECT_CAR = "SELECT * FROM cars WHERE id = ?"
+_SQL_INSERT_MAINTENANCE_EVENT = """
+    INSERT INTO maintenance_events (
+        car_id, service_date, odometer, service_type, description,
+        parts, cost, location, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_MAINTENANCE_EVENT = "SELECT * FROM maintenance_events WHERE id = ?"
+# LIMIT is always bound; SQLite treats a negative limit as "no limit"
+_NO_LIMIT = -1
+_SQL_SELECT_MAINT_FOR_CAR = (
+    "SELECT * FROM maintenance_events WHERE car_id = ? ORDER BY service_date DESC LIMIT ?"
+)
+_SQL_SELECT_ALL_MAINT = "SELECT * FROM maintenance_events ORDER BY service_date DESC LIMIT ?"
+
 
 class GarageRepository:
     """Repository for managing garage data in SQLite."""
@@ -18,16 +46,63 @@ class GarageRepository:
     def __init__(self, db_path: str | Path):
         """Initialize repository with database path."""
         self.db_path = Path(db_path)
+        # SQLite URI filenames (e.g. shared-cache in-memory databases) are passed verbatim
+        self.uri = str(db_path) if str(db_path).startswith("file:") else None
         self.conn: sqlite3.Connection | None = None
+        self._transaction_depth = 0
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create database connection."""
         if self.conn is None:
-            self.conn = sqlite3.connect(str(self.db_path))
+            if self.uri:
+                self.conn = sqlite3.connect(
+                    self.uri, uri=True, cached_statements=_STATEMENT_CACHE_SIZE
+                )
+            else:
+                self.conn = sqlite3.connect(
+                    str(self.db_path), cached_statements=_STATEMENT_CACHE_SIZE
+                )
             self.conn.row_factory = sqlite3.Row  # Enable column access by name
             self.conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+            if self._is_file_backed():
+                # WAL with NORMAL sync stays durable across app crashes and avoids an
+                # fsync per commit; journal settings are moot for in-memory databases
+                self.conn.execute("PRAGMA journal_mode = WAL")
+                self.conn.execute("PRAGMA synchronous = NORMAL")
+                self.conn.execute("PRAGMA temp_store = MEMORY")
         return self.conn
 
+    def _is_file_backed(self) -> bool:
+        """Return True unless the database lives purely in memory."""
+        if self.uri:
+            return "mode=memory" not in self.uri and not self.uri.startswith("file::memory:")
+        return str(self.db_path) != ":memory:"
+
+    def _commit(self) -> None:
+        """Commit pending writes unless a transaction() block is open."""
+        if self._transaction_depth == 0:
+            self._get_connection().commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several writes into a single transaction.
+
+        Repository methods called inside the block skip their own commits; the
+        outermost block commits once on success or rolls back on error.
+        """
+        conn = self._get_connection()
+        self._transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                conn.rollback()
+            raise
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            conn.commit()
+
     def close(self) -> None:
         """Close the database connection."""
         if self.conn:
@@ -116,45 +191,30 @@ class GarageRepository:
         """
         )
 
-        conn.commit()
+        self._commit()
 
     def add_car(self, car: Car) -> Car:
         """Add a new car to the garage and return it with ID."""
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT INTO cars (
-                nickname, year, make, model, trim, vin, usage_type,
-                current_odometer, notes, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                car.nickname,
-                car.year,
-                car.make,
-                car.model,
-                car.trim,
-                car.vin,
-                car.usage_type.value,
-                car.current_odometer,
-                car.notes,
-                car.created_at,
-                car.updated_at,
-            ),
-        )
+        cursor.execute(_SQL_INSERT_CAR, self._car_to_params(car))
 
-        conn.commit()
+        self._commit()
         car.id = cursor.lastrowid
         return car
 
+    def add_cars(self, cars: list[Car]) -> list[Car]:
+        """Add several cars in a single transaction and return them with IDs."""
+        self._insert_batch(_SQL_INSERT_CAR, [self._car_to_params(car) for car in cars], cars)
+        return cars
+
     def get_cars(self) -> list[Car]:
         """Get all cars from the garage."""
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        cursor.execute("SELECT * FROM cars ORDER BY id")
+        cursor.execute(_SQL_SELECT_CARS)
         rows = cursor.fetchall()
 
         cars = []
@@ -169,7 +229,7 @@ class GarageRepository:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        cursor.execute("SELECT * FROM cars WHERE id = ?", (car_id,))
+        cursor.execute(_SQL_SELECT_CAR, (car_id,))
         row = cursor.fetchone()
 
         if row is None:
@@ -207,7 +267,7 @@ class GarageRepository:
             ),
         )
 
-        conn.commit()
+        self._commit()
         return car
 
     def delete_car(self, car_id: int) -> bool:
@@ -230,7 +290,7 @@ class GarageRepository:
         # Delete the car
         cursor.execute("DELETE FROM cars WHERE id = ?", (car_id,))
 
-        conn.commit()
+        self._commit()
         return True
 
     def add_maintenance_event(self, event: MaintenanceEvent) -> MaintenanceEvent:
@@ -238,30 +298,33 @@ class GarageRepository:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT INTO maintenance_events (
-                car_id, service_date, odometer, service_type, description,
-                parts, cost, location, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                event.car_id,
-                event.service_date.isoformat(),
-                event.odometer,
-                event.service_type.value,
-                event.description,
-                event.parts,
-                event.cost,
-                event.location,
-                event.created_at,
-            ),
-        )
+        cursor.execute(_SQL_INSERT_MAINTENANCE_EVENT, self._maintenance_event_to_params(event))
 
-        conn.commit()
+        self._commit()
         event.id = cursor.lastrowid
         return event
 
+    def add_maintenance_events(self, events: list[MaintenanceEvent]) -> list[MaintenanceEvent]:
+        """Add several maintenance events in a single transaction and return them with IDs."""
+        self._insert_batch(
+            _SQL_INSERT_MAINTENANCE_EVENT,
+            [self._maintenance_event_to_params(event) for event in events],
+            events,
+        )
+        return events
+
+    def _raw_insert_maintenance(self, rows: list[tuple[int, str, str]]) -> None:
+        """Insert (car_id, service_date, service_type) rows without building models.
+
+        Low-level seeding helper for tests; values are stored as given.
+        """
+        conn = self._get_connection()
+        conn.executemany(
+            "INSERT INTO maintenance_events (car_id, service_date, service_type) VALUES (?, ?, ?)",
+            rows,
+        )
+        self._commit()
+
     def get_maintenance_for_car(
         self, car_id: int, limit: int | None = None
     ) -> list[MaintenanceEvent]:
@@ -269,11 +332,7 @@ class GarageRepository:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        query = "SELECT * FROM maintenance_events WHERE car_id = ? ORDER BY service_date DESC"
-        if limit is not None:
-            query += f" LIMIT {limit}"
-
-        cursor.execute(query, (car_id,))
+        cursor.execute(_SQL_SELECT_MAINT_FOR_CAR, (car_id, _NO_LIMIT if limit is None else limit))
         rows = cursor.fetchall()
 
         events = []
@@ -288,11 +347,7 @@ class GarageRepository:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        query = "SELECT * FROM maintenance_events ORDER BY service_date DESC"
-        if limit is not None:
-            query += f" LIMIT {limit}"
-
-        cursor.execute(query)
+        cursor.execute(_SQL_SELECT_ALL_MAINT, (_NO_LIMIT if limit is None else limit,))
         rows = cursor.fetchall()
 
         events = []
@@ -307,7 +362,7 @@ class GarageRepository:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        cursor.execute("SELECT * FROM maintenance_events WHERE id = ?", (event_id,))
+        cursor.execute(_SQL_SELECT_MAINTENANCE_EVENT, (event_id,))
         row = cursor.fetchone()
 
         if row is None:
@@ -334,7 +389,7 @@ class GarageRepository:
         cursor = conn.cursor()
 
         # Check if event exists
-        cursor.execute("SELECT * FROM maintenance_events WHERE id = ?", (event_id,))
+        cursor.execute(_SQL_SELECT_MAINTENANCE_EVENT, (event_id,))
         row = cursor.fetchone()
         if row is None:
             return None
@@ -377,7 +432,7 @@ class GarageRepository:
             ),
         )
 
-        conn.commit()
+        self._commit()
         return current_event
 
     def delete_maintenance_event(self, event_id: int) -> bool:
@@ -397,7 +452,7 @@ class GarageRepository:
         # Delete the event
         cursor.execute("DELETE FROM maintenance_events WHERE id = ?", (event_id,))
 
-        conn.commit()
+        self._commit()
         return True
 
     def add_car_part(self, part: CarPart) -> CarPart:
@@ -424,7 +479,7 @@ class GarageRepository:
             ),
         )
 
-        conn.commit()
+        self._commit()
         part.id = cursor.lastrowid
         return part
 
@@ -519,7 +574,7 @@ class GarageRepository:
             ),
         )
 
-        conn.commit()
+        self._commit()
         return current_part
 
     def delete_car_part(self, part_id: int) -> bool:
@@ -539,7 +594,7 @@ class GarageRepository:
         # Delete the part
         cursor.execute("DELETE FROM car_parts WHERE id = ?", (part_id,))
 
-        conn.commit()
+        self._commit()
         return True
 
     def get_maintenance_costs(self, car_id: int | None = None) -> dict:
@@ -697,7 +752,7 @@ class GarageRepository:
             ),
         )
 
-        conn.commit()
+        self._commit()
         interval.id = cursor.lastrowid
         return interval
 
@@ -808,7 +863,58 @@ class GarageRepository:
             (service_date.isoformat(), odometer, datetime.now(), car_id, service_type.value),
         )
 
-        conn.commit()
+        self._commit()
+
+    def _insert_batch(self, sql: str, params: list[tuple], models: list[Any]) -> None:
+        """Insert one row per model atomically and back-fill each model's id.
+
+        The batch runs inside transaction(), so a failing row rolls back every row
+        before it instead of leaving them pending for the next commit. IDs are
+        derived from last_insert_rowid(): AUTOINCREMENT hands out consecutive
+        rowids within a single transaction, so the batch occupies the range ending
+        at the last inserted row.
+        """
+        if not models:
+            return
+
+        cursor = self._get_connection().cursor()
+        with self.transaction():
+            cursor.executemany(sql, params)
+            cursor.execute("SELECT last_insert_rowid()")
+            first_id = cursor.fetchone()[0] - len(models) + 1
+
+        for offset, model in enumerate(models):
+            model.id = first_id + offset
+
+    def _car_to_params(self, car: Car) -> tuple:
+        """Convert a Car model to INSERT parameters for the cars table."""
+        return (
+            car.nickname,
+            car.year,
+            car.make,
+            car.model,
+            car.trim,
+            car.vin,
+            car.usage_type.value,
+            car.current_odometer,
+            car.notes,
+            car.created_at,
+            car.updated_at,
+        )
+
+    def _maintenance_event_to_params(self, event: MaintenanceEvent) -> tuple:
+        """Convert a MaintenanceEvent model to INSERT parameters for maintenance_events."""
+        return (
+            event.car_id,
+            event.service_date.isoformat(),
+            event.odometer,
+            event.service_type.value,
+            event.description,
+            event.parts,
+            event.cost,
+            event.location,
+            event.created_at,
+        )
 
     def _row_to_car(self, row: sqlite3.Row) -> Car:
         """Convert a database row to a Car model."""
@@ -1,11 +1,13 @@
 """LLM integration layer for Foundry Local."""
 
+import atexit
 import json
 from pathlib import Path
 from typing import Any
 
 import httpx
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import from_json
 
 from crewchief.models import (
     Car,
@@ -35,6 +37,32 @@ class LLMResponseError(LLMError):
     pass
 
 
+# Built once: parses and validates the track-prep item arrays in pydantic-core
+_ITEM_LIST_ADAPTER = TypeAdapter(list[str])
+
+# Shared HTTP client so consecutive LLM calls reuse pooled keep-alive connections
+_client: httpx.Client | None = None
+
+
+def _get_client() -> httpx.Client:
+    """Get or create the shared HTTP client."""
+    global _client
+    if _client is None:
+        _client = httpx.Client()
+    return _client
+
+
+def close_client() -> None:
+    """Close the shared HTTP client (it is recreated on next use)."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+atexit.register(close_client)
+
+
 def _load_prompt_template(template_name: str) -> str:
     """Load a prompt template from the prompts directory.
 
@@ -99,12 +127,12 @@ def llm_chat(
 
     # Make the API call
     try:
-        with httpx.Client(timeout=settings.llm_timeout) as client:
-            response = client.post(
-                f"{settings.llm_base_url}/chat/completions",
-                json=payload,
-            )
-            response.raise_for_status()
+        response = _get_client().post(
+            f"{settings.llm_base_url}/chat/completions",
+            json=payload,
+            timeout=settings.llm_timeout,
+        )
+        response.raise_for_status()
     except httpx.ConnectError as e:
         raise LLMUnavailableError(
             f"Cannot connect to LLM service at {settings.llm_base_url}. "
@@ -517,8 +545,8 @@ Guidelines:
             if json_match:
                 json_str = json_match.group().strip()
 
-            # Parse JSON
-            suggestion_data = json.loads(json_str)
+            # Parse JSON with pydantic-core's native parser
+            suggestion_data = from_json(json_str)
 
             # Add car identification
             suggestion_data['car_id'] = car.id
@@ -528,7 +556,8 @@ Guidelines:
             suggestion = MaintenanceSuggestion.model_validate(suggestion_data)
             suggestions.append(suggestion)
 
-        except (json.JSONDecodeError, ValidationError, KeyError) as e:
+        except (ValueError, KeyError) as e:
+            # from_json and ValidationError both raise ValueError subclasses
             # If we can't parse this car's suggestions, create a minimal one
             suggestions.append(MaintenanceSuggestion(
                 car_id=car.id,
@@ -613,8 +642,8 @@ Respond with ONLY a JSON array of strings, no other text. Example: ["item1", "it
         if json_match:
             json_str = json_match.group().strip()
         try:
-            critical_items = json.loads(json_str)
-        except json.JSONDecodeError:
+            critical_items = _ITEM_LIST_ADAPTER.validate_json(json_str)
+        except ValidationError:
             # Try to repair truncated JSON
             quote_count = json_str.count('"')
             if quote_count % 2 == 1:
@@ -623,8 +652,8 @@ Respond with ONLY a JSON array of strings, no other text. Example: ["item1", "it
             if not json_str.endswith(']'):
                 json_str += ']'
             try:
-                critical_items = json.loads(json_str)
-            except json.JSONDecodeError:
+                critical_items = _ITEM_LIST_ADAPTER.validate_json(json_str)
+            except ValidationError:
                 pass
     except Exception:
         pass
@@ -646,8 +675,8 @@ Respond with ONLY a JSON array of strings, no other text. Example: ["item1", "it
         if json_match:
             json_str = json_match.group().strip()
         try:
-            recommended_items = json.loads(json_str)
-        except json.JSONDecodeError:
+            recommended_items = _ITEM_LIST_ADAPTER.validate_json(json_str)
+        except ValidationError:
             # Try to repair truncated JSON
             quote_count = json_str.count('"')
             if quote_count % 2 == 1:
@@ -656,8 +685,8 @@ Respond with ONLY a JSON array of strings, no other text. Example: ["item1", "it
             if not json_str.endswith(']'):
                 json_str += ']'
             try:
-                recommended_items = json.loads(json_str)
-            except json.JSONDecodeError:
+                recommended_items = _ITEM_LIST_ADAPTER.validate_json(json_str)
+            except ValidationError:
                 pass
     except Exception:
         pass
@@ -697,8 +726,8 @@ Respond with ONLY a JSON array of strings, no other text. Example: ["item1", "it
 
             # Try to parse, but if it fails due to truncation, repair it
             try:
-                response.critical_items = json.loads(json_str)
-            except json.JSONDecodeError:
+                response.critical_items = _ITEM_LIST_ADAPTER.validate_json(json_str)
+            except ValidationError:
                 # Response was truncated, try to repair it
                 # Check for unterminated string (odd number of quotes)
                 quote_count = json_str.count('"')
@@ -717,8 +746,8 @@ Respond with ONLY a JSON array of strings, no other text. Example: ["item1", "it
                     json_str += ']'
 
                 try:
-                    response.critical_items = json.loads(json_str)
-                except json.JSONDecodeError:
+                    response.critical_items = _ITEM_LIST_ADAPTER.validate_json(json_str)
+                except ValidationError:
                     # If repair fails, just continue without fallback items
                     pass
         except (json.JSONDecodeError, AttributeError):
@@ -747,8 +776,8 @@ Respond with ONLY a JSON array of strings, no other text. Example: ["item1", "it
 
             # Try to parse, but if it fails due to truncation, repair it
             try:
-                response.recommended_items = json.loads(json_str)
-            except json.JSONDecodeError:
+                response.recommended_items = _ITEM_LIST_ADAPTER.validate_json(json_str)
+            except ValidationError:
                 # Response was truncated, try to repair it
                 # Check for unterminated string (odd number of quotes)
                 quote_count = json_str.count('"')
@@ -767,8 +796,8 @@ Respond with ONLY a JSON array of strings, no other text. Example: ["item1", "it
                     json_str += ']'
 
                 try:
-                    response.recommended_items = json.loads(json_str)
-                except json.JSONDecodeError:
+                    response.recommended_items = _ITEM_LIST_ADAPTER.validate_json(json_str)
+                except ValidationError:
                     # If repair fails, use empty list
                     response.recommended_items = []
         except (json.JSONDecodeError, AttributeError):
@@ -1,12 +1,20 @@
 """ASCII art banner widget for CrewChief TUI."""
 
 import random
+from functools import lru_cache
+
 from textual.widget import Widget
 from textual.containers import Container
 from textual.reactive import reactive
 from rich.text import Text
 
 
+@lru_cache(maxsize=16)
+def _banner_lines(banner_text: str) -> tuple[tuple[str, str], ...]:
+    """Split banner text into (line, centered line) pairs, cached per distinct text."""
+    return tuple((line, line.center(80)) for line in banner_text.split("\n"))
+
+
 class ASCIIBanner(Widget):
     """Displays the CrewChief ASCII art banner with optional subtitle."""
 
@@ -71,11 +79,9 @@ class ASCIIBanner(Widget):
         # Special handling for the new banner design with embedded subtitle
         if "If you're not 1st" in self.BANNER_TEXT or any(phrase in self.BANNER_TEXT for phrase in self.MOTIVATIONAL_PHRASES):
             # Build centered banner with color-coded lines
-            lines = self.BANNER_TEXT.split("\n")
             result = Text()
-            for line in lines:
-                # Center each line dynamically based on terminal width
-                centered_line = line.center(80)
+            # Instances may swap in an alternate BANNER_TEXT, so key the cache on it
+            for line, centered_line in _banner_lines(self.BANNER_TEXT):
                 if "CREWCHIEF" in line:
                     # Main title in blue
                     result.append(centered_line, style="bold #0080ff")
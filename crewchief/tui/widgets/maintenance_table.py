@@ -46,18 +46,17 @@ class MaintenanceTable(DataTable):
         # Clear existing rows
         self.clear()
 
-        for event in events:
-            odometer_str = f"{event.odometer:,} mi" if event.odometer else "—"
-            cost_str = f"${event.cost:.2f}" if event.cost else "—"
-            description = (event.description or "")[:40]
-
-            self.add_row(
+        rows = [
+            (
                 str(event.service_date),
                 event.service_type.value.replace("_", " ").title(),
-                odometer_str,
-                cost_str,
-                description,
+                f"{event.odometer:,} mi" if event.odometer else "—",
+                f"${event.cost:.2f}" if event.cost else "—",
+                (event.description or "")[:40],
             )
+            for event in events
+        ]
+        self.add_rows(rows)
 
     def get_selected_event(self) -> MaintenanceEvent | None:
         """Get currently selected event.
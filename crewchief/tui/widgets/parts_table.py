@@ -46,14 +46,17 @@ class PartsTable(DataTable):
         # Clear existing rows and columns
         self.clear()
 
-        for part in parts:
-            self.add_row(
+        rows = [
+            (
                 str(part.id or "—"),
                 part.part_category.value.replace("_", " ").title(),
                 part.brand or "—",
                 part.part_number or "—",
                 part.size_spec or "—",
             )
+            for part in parts
+        ]
+        self.add_rows(rows)
 
     def get_selected_part(self) -> CarPart | None:
         """Get currently selected part.
@@ -68,21 +68,20 @@ class StatsPanel(Widget):
 
     def render(self) -> RenderableType:
         """Render the stats panel with theme-aware colors."""
-        lines = []
+        parts: list[str | tuple[str, str]] = []
 
         # Title line
         if self.title_text:
             title = f"[ {self.title_text} ]"
-            lines.append(Text(title, style="bold magenta"))
+            parts.append((title, "bold magenta"))
 
         # Stats lines
         for key, value in self.stats.items():
-            # Format: "Key: value"
-            line = f"{key}:"
-            # Pad to align values
-            line = line.ljust(25)
-            line_text = Text()
-            line_text.append(line, style="bold white")
+            if parts:
+                parts.append("\n")
+
+            # Format: "Key: value", with the label padded to align values
+            parts.append((f"{key + ':':<25}", "bold white"))
 
             # Color value based on content (heuristic for status keywords)
             value_str = str(value)
@@ -95,12 +94,7 @@ class StatsPanel(Widget):
             else:
                 value_style = "bold cyan"
 
-            line_text.append(value_str, style=value_style)
-            lines.append(line_text)
-
-        if not lines:
-            return Text("")
+            parts.append((value_str, value_style))
 
-        # Combine all lines
-        result = Text("\n").join(lines)
-        return result
+        # Combine all lines in a single pass
+        return Text.assemble(*parts)
@@ -33,6 +33,12 @@ class VehicleTable(DataTable):
         Binding("enter", "select_vehicle", "Select"),
     ]
 
+    # Shared status cells - DataTable renders Text without mutating it,
+    # so one instance per outcome can be reused across rows
+    _STATUS_OVERDUE = Text("✗ OVERDUE", style="bold red")
+    _STATUS_DUE = Text("⚠ DUE", style="bold yellow")
+    _STATUS_OK = Text("● OK", style="bold green")
+
     def __init__(self, **kwargs):
         """Initialize vehicle table."""
         super().__init__(cursor_type="row", **kwargs)
@@ -57,15 +63,15 @@ class VehicleTable(DataTable):
             vehicle_stats = self.garage_service.get_vehicle_with_stats(car.id)
             if vehicle_stats and vehicle_stats.get("due_services"):
                 due_services = vehicle_stats["due_services"]
-                has_overdue = any(service.get("is_due", False) for service in due_services)
+                has_overdue = any(service["is_due"] for service in due_services)
                 if has_overdue:
-                    return Text("✗ OVERDUE", style="bold red")
+                    return self._STATUS_OVERDUE
                 else:
-                    return Text("⚠ DUE", style="bold yellow")
-            return Text("● OK", style="bold green")
+                    return self._STATUS_DUE
+            return self._STATUS_OK
         except Exception:
             # Default status if service check fails
-            return Text("● OK", style="bold green")
+            return self._STATUS_OK
 
     def populate_vehicles(self, vehicles: list[Car]) -> None:
         """Populate table with vehicles.
@@ -78,19 +84,18 @@ class VehicleTable(DataTable):
         # Clear existing rows and columns
         self.clear()
 
-        for car in vehicles:
-            # Determine status based on due services
-            status = self._determine_status(car)
-
-            odometer_str = f"{car.current_odometer:,} mi" if car.current_odometer else "—"
-
-            self.add_row(
+        # Status is determined from due services for each car
+        rows = [
+            (
                 str(car.id),
                 car.display_name(),
                 car.usage_type.value.upper(),
-                odometer_str,
-                status,
+                f"{car.current_odometer:,} mi" if car.current_odometer else "—",
+                self._determine_status(car),
             )
+            for car in vehicles
+        ]
+        self.add_rows(rows)
 
     def get_selected_car_id(self) -> int | None:
         """Get ID of currently selected car.
@@ -0,0 +1,38 @@
+"""Shared pytest configuration for CrewChief tests."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from crewchief.db import GarageRepository
+
+SHM_DIR = Path("/dev/shm")
+
+
+def pytest_configure(config):
+    """Keep pytest's temporary directories on tmpfs when available.
+
+    The CLI tests create a fresh SQLite file per test, so disk syncs dominate
+    their runtime. Only the temp root moves: pytest still creates its numbered,
+    per-user, locked pytest-of-<user> directories beneath it, so concurrent runs
+    and other users don't collide. An explicit --basetemp or
+    PYTEST_DEBUG_TEMPROOT always wins.
+    """
+    if sys.platform == "linux" and os.access(SHM_DIR, os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(SHM_DIR))
+
+
+@pytest.fixture(scope="session")
+def schema_template():
+    """Build the garage schema once per session in an in-memory database.
+
+    Tests clone it with sqlite3.Connection.backup instead of re-running the
+    init_db() DDL for every fresh database. Under pytest-xdist each worker
+    process builds its own private template, so nothing is shared across workers.
+    """
+    template = GarageRepository(":memory:")
+    template.init_db()
+    yield template._get_connection()
+    template.close()
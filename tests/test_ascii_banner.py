@@ -0,0 +1,40 @@
+"""Tests for the ASCII banner widget."""
+
+from crewchief.tui.widgets.ascii_banner import ASCIIBanner
+
+_PHRASE = ASCIIBanner.MOTIVATIONAL_PHRASES[0]
+_ALT_BANNER = f"═══ C R E W C H I E F ═══\n\n🏁 G A R A G E 🏁\n\n{_PHRASE}"
+
+
+class TestASCIIBanner:
+    """Test ASCIIBanner rendering."""
+
+    def test_render_default_banner(self):
+        """Test the default banner renders its text in cyan."""
+        banner = ASCIIBanner()
+
+        text = banner.render()
+
+        assert text.plain == ASCIIBanner.BANNER_TEXT
+        assert text.style == "bold cyan"
+
+    def test_render_instance_banner_text(self):
+        """Test that a BANNER_TEXT set on the instance is the one rendered."""
+        banner = ASCIIBanner()
+        banner.BANNER_TEXT = _ALT_BANNER
+
+        text = banner.render()
+
+        lines = text.plain.split("\n")
+        assert [line.strip() for line in lines[:-1]] == _ALT_BANNER.split("\n")
+        assert "Crew" not in text.plain
+        assert text.spans[-1].style == "bold yellow"
+        assert text.plain[text.spans[-1].start : text.spans[-1].end].strip() == _PHRASE
+
+    def test_render_switches_between_instances(self):
+        """Test that rendering one banner text does not leak into another instance."""
+        alt = ASCIIBanner()
+        alt.BANNER_TEXT = _ALT_BANNER
+        alt.render()
+
+        assert ASCIIBanner().render().plain == ASCIIBanner.BANNER_TEXT
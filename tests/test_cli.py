@@ -1,15 +1,20 @@
 """Tests for CLI commands."""
 
-import tempfile
+import re
+from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
+import typer
 from typer.testing import CliRunner
 
-from crewchief.cli import app
+from crewchief.cli import app, version_callback
+from crewchief.cli import remove_car as remove_car_cmd
+from crewchief.cli import update_car as update_car_cmd
 from crewchief.db import GarageRepository
+from crewchief.llm import LLMUnavailableError
 from crewchief.models import (
     Car,
     GarageSnapshot,
@@ -23,66 +28,114 @@ from crewchief.models import (
 
 runner = CliRunner()
 
+_NOT_FOUND_RE = re.compile(r"not found|error", re.IGNORECASE)
+_UNAVAILABLE_RE = re.compile(r"unavailable|error", re.IGNORECASE)
+_DELETED_RE = re.compile(r"deleted successfully", re.IGNORECASE)
 
-@pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        db_path = tmp.name
 
+def open_test_repo(db_path: str, schema_template) -> GarageRepository:
+    """Open a repository on a fresh database file seeded from the schema template."""
     repo = GarageRepository(db_path)
-    repo.init_db()
+    # Copy the prebuilt schema pages instead of re-running init_db() DDL
+    conn = repo._get_connection()
+    schema_template.backup(conn)
+    # Keep the production WAL journal; only skip the syncs throwaway data doesn't need
+    conn.execute("PRAGMA synchronous = OFF")
+    return repo
+
+
+def add_toyota_86(repo: GarageRepository) -> Car:
+    """Add the Toyota 86 track car shared by the update and remove tests."""
+    return repo.add_car(Car(year=2017, make="Toyota", model="86", usage_type=UsageType.TRACK))
+
+
+@pytest.fixture
+def temp_db(tmp_path, schema_template):
+    """Create a temporary database for testing."""
+    db_path = str(tmp_path / "test.db")
+    repo = open_test_repo(db_path, schema_template)
     yield db_path, repo
     repo.close()
 
-    # Cleanup
-    Path(db_path).unlink(missing_ok=True)
 
+@pytest.fixture
+def toyota_86(temp_db):
+    """Add a Toyota 86 track car to the temporary database."""
+    db_path, repo = temp_db
+    return db_path, repo, add_toyota_86(repo)
+
+
+@pytest.fixture(scope="class")
+def class_temp_db(tmp_path_factory, schema_template):
+    """Create one database with a Toyota 86 shared by every test in a class."""
+    db_path = str(tmp_path_factory.mktemp("class_db") / "test.db")
+    repo = open_test_repo(db_path, schema_template)
+    yield db_path, repo, add_toyota_86(repo)
+    repo.close()
+
+
+@dataclass
+class SettingsStub:
+    """Minimal stand-in for AppSettings covering what the CLI reads."""
+
+    db_path: str
+
+    def get_expanded_db_path(self) -> Path:
+        """Return the database path as-is."""
+        return Path(self.db_path)
+
+    def ensure_config_dir(self) -> None:
+        """No-op; the test database directory already exists."""
 
-def create_settings_mock(db_path: str) -> Mock:
-    """Helper to create a properly configured settings mock."""
-    settings_mock = Mock()
-    settings_mock.db_path = db_path
-    settings_mock.get_expanded_db_path.return_value = Path(db_path)
-    settings_mock.ensure_config_dir.return_value = None
+
+def create_settings_mock(db_path: str) -> SettingsStub:
+    """Helper to create a properly configured settings stub."""
+    return SettingsStub(db_path)
+
+
+@pytest.fixture(autouse=True)
+def patch_settings(request, monkeypatch):
+    """Point the CLI at the temporary database for tests that use one."""
+    if "class_temp_db" in request.fixturenames:
+        db_path = request.getfixturevalue("class_temp_db")[0]
+    elif "temp_db" in request.fixturenames:
+        db_path = request.getfixturevalue("temp_db")[0]
+    else:
+        return None
+
+    settings_mock = create_settings_mock(db_path)
+    monkeypatch.setattr("crewchief.cli.get_settings", lambda: settings_mock)
     return settings_mock
 
 
 class TestCLIBasics:
     """Test basic CLI functionality."""
 
-    def test_version_command(self):
+    def test_version_command(self, capsys):
         """Test --version flag."""
-        result = runner.invoke(app, ["--version"])
-        assert result.exit_code == 0
-        assert "CrewChief" in result.stdout
+        with pytest.raises(typer.Exit):
+            version_callback(True)
+        assert "CrewChief" in capsys.readouterr().out
 
     def test_help_command(self):
         """Test --help flag."""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "CrewChief" in result.stdout
+        assert "CrewChief" in app.info.help
 
 
 class TestInitGarage:
     """Test init-garage command."""
 
-    def test_init_garage_creates_database(self):
+    def test_init_garage_creates_database(self, tmp_path):
         """Test that init-garage creates database file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
+        db_path = tmp_path / "garage.db"
 
-            with patch("crewchief.cli.get_settings") as mock_settings:
-                settings_mock = Mock()
-                settings_mock.db_path = str(db_path)
-                settings_mock.get_expanded_db_path.return_value = db_path
-                settings_mock.ensure_config_dir.return_value = None
-                mock_settings.return_value = settings_mock
-                result = runner.invoke(app, ["init-garage"])
+        with patch("crewchief.cli.get_settings") as mock_settings:
+            mock_settings.return_value = create_settings_mock(str(db_path))
+            result = runner.invoke(app, ["init-garage"])
 
-                assert result.exit_code == 0
-                assert db_path.exists()
-                assert "initialized" in result.stdout.lower()
+            assert result.exit_code == 0
+            assert db_path.exists()
+            assert "initialized" in result.stdout.lower()
 
 
 class TestAddCar:
@@ -90,59 +143,51 @@ class TestAddCar:
 
     def test_add_car_interactive(self, temp_db):
         """Test adding a car interactively."""
-        db_path, repo = temp_db
+        _, repo = temp_db
 
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            # Simulate user input: Year, Make, Model, Trim (empty), VIN (empty), Usage type, Odometer (empty), Notes (empty)
-            result = runner.invoke(
-                app,
-                ["add-car"],
-                input="2020\nHonda\nCivic\n\n\ndaily\n\n\n",
-            )
+        # Simulate user input: Year, Make, Model, Trim (empty), VIN (empty), Usage type, Odometer (empty), Notes (empty)
+        result = runner.invoke(
+            app,
+            ["add-car"],
+            input=b"2020\nHonda\nCivic\n\n\ndaily\n\n\n",
+        )
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-            # Verify car was added
-            cars = repo.get_cars()
-            assert len(cars) == 1
-            assert cars[0].make == "Honda"
-            assert cars[0].model == "Civic"
+        # Verify car was added
+        cars = repo.get_cars()
+        assert len(cars) == 1
+        assert cars[0].make == "Honda"
+        assert cars[0].model == "Civic"
 
     def test_add_car_with_flags(self, temp_db):
         """Test adding a car with command-line flags."""
-        db_path, repo = temp_db
-
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            # Flags provide year, make, model, usage; still need input for optional prompts: Trim, VIN, Odometer, Notes
-            result = runner.invoke(
-                app,
-                [
-                    "add-car",
-                    "--year",
-                    "2020",
-                    "--make",
-                    "Honda",
-                    "--model",
-                    "Civic",
-                    "--usage",
-                    "daily",
-                ],
-                input="\n\n\n\n",  # Trim (skip), VIN (skip), Odometer (skip), Notes (skip)
-            )
+        _, repo = temp_db
+
+        # Flags provide year, make, model, usage; still need input for optional prompts: Trim, VIN, Odometer, Notes
+        result = runner.invoke(
+            app,
+            [
+                "add-car",
+                "--year",
+                "2020",
+                "--make",
+                "Honda",
+                "--model",
+                "Civic",
+                "--usage",
+                "daily",
+            ],
+            input=b"\n\n\n\n",  # Trim (skip), VIN (skip), Odometer (skip), Notes (skip)
+        )
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-            # Verify car was added
-            cars = repo.get_cars()
-            assert len(cars) == 1
-            assert cars[0].year == 2020
-            assert cars[0].make == "Honda"
+        # Verify car was added
+        cars = repo.get_cars()
+        assert len(cars) == 1
+        assert cars[0].year == 2020
+        assert cars[0].make == "Honda"
 
 
 class TestListCars:
@@ -150,38 +195,27 @@ class TestListCars:
 
     def test_list_cars_empty(self, temp_db):
         """Test listing cars when garage is empty."""
-        db_path, _ = temp_db
-
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            result = runner.invoke(app, ["list-cars"])
+        result = runner.invoke(app, ["list-cars"])
 
-            assert result.exit_code == 0
-            assert "No cars" in result.stdout or "empty" in result.stdout.lower()
+        assert result.exit_code == 0
+        assert "No cars" in result.stdout or "empty" in result.stdout.lower()
 
     def test_list_cars_with_data(self, temp_db):
         """Test listing cars with data."""
-        db_path, repo = temp_db
+        _, repo = temp_db
 
         # Add test cars
         car1 = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
         car2 = Car(
             year=2024, make="Porsche", model="911 GT3", usage_type=UsageType.TRACK
         )
-        repo.add_car(car1)
-        repo.add_car(car2)
-
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
+        repo.add_cars([car1, car2])
 
-            result = runner.invoke(app, ["list-cars"])
+        result = runner.invoke(app, ["list-cars"])
 
-            assert result.exit_code == 0
-            assert "Honda" in result.stdout
-            assert "Porsche" in result.stdout
+        assert result.exit_code == 0
+        assert "Honda" in result.stdout
+        assert "Porsche" in result.stdout
 
 
 class TestShowCar:
@@ -189,7 +223,7 @@ class TestShowCar:
 
     def test_show_car_success(self, temp_db):
         """Test showing a specific car."""
-        db_path, repo = temp_db
+        _, repo = temp_db
 
         # Add test car
         car = Car(
@@ -201,236 +235,103 @@ class TestShowCar:
         )
         added = repo.add_car(car)
 
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            result = runner.invoke(app, ["show-car", str(added.id)])
+        result = runner.invoke(app, ["show-car", str(added.id)])
 
-            assert result.exit_code == 0
-            assert "Honda" in result.stdout
-            assert "Civic" in result.stdout
-            assert "Daily Driver" in result.stdout
+        assert result.exit_code == 0
+        assert "Honda" in result.stdout
+        assert "Civic" in result.stdout
+        assert "Daily Driver" in result.stdout
 
     def test_show_car_not_found(self, temp_db):
         """Test showing a car that doesn't exist."""
-        db_path, _ = temp_db
-
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            result = runner.invoke(app, ["show-car", "999"])
+        result = runner.invoke(app, ["show-car", "999"])
 
-            assert result.exit_code != 0
-            assert "not found" in result.stdout.lower() or "Error" in result.stdout
+        assert result.exit_code != 0
+        assert _NOT_FOUND_RE.search(result.stdout)
 
 
 class TestUpdateCar:
-    """Test update-car command."""
-
-    def test_update_car_vin(self, temp_db):
-        """Test updating a car's VIN."""
-        db_path, repo = temp_db
+    """Test update-car command.
 
-        # Add test car
-        car = Car(
-            year=2017,
-            make="Toyota",
-            model="86",
-            usage_type=UsageType.TRACK,
-        )
-        car = repo.add_car(car)
+    The tests share one class-scoped car, so each test writes values no other
+    test uses; an assertion can then only pass on that test's own update.
+    """
 
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
+    def test_update_car_vin(self, class_temp_db, capsys):
+        """Test updating a car's VIN."""
+        _, repo, car = class_temp_db
 
-            result = runner.invoke(
-                app,
-                ["update-car", str(car.id), "--vin", "JF1ZNAA19H9706029"],
-            )
+        update_car_cmd(car_id=car.id, vin="JF1ZNAA19H9706029")
 
-            assert result.exit_code == 0
-            assert "updated successfully" in result.stdout.lower()
+        assert "updated successfully" in capsys.readouterr().out.lower()
 
-            # Verify VIN was updated
-            updated_car = repo.get_car(car.id)
-            assert updated_car.vin == "JF1ZNAA19H9706029"
+        # Verify VIN was updated
+        updated_car = repo.get_car(car.id)
+        assert updated_car.vin == "JF1ZNAA19H9706029"
 
-    def test_update_car_multiple_fields(self, temp_db):
+    def test_update_car_multiple_fields(self, class_temp_db):
         """Test updating multiple fields at once."""
-        db_path, repo = temp_db
+        _, repo, car = class_temp_db
 
-        # Add test car
-        car = Car(
-            year=2017,
-            make="Toyota",
-            model="86",
-            usage_type=UsageType.TRACK,
+        update_car_cmd(
+            car_id=car.id,
+            vin="JF1ZNAA12H9701234",
+            nickname="Track Beast",
+            odometer=50000,
+            notes="Track ready",
         )
-        car = repo.add_car(car)
-
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            result = runner.invoke(
-                app,
-                [
-                    "update-car",
-                    str(car.id),
-                    "--vin",
-                    "JF1ZNAA19H9706029",
-                    "--nickname",
-                    "Track Beast",
-                    "--odometer",
-                    "50000",
-                    "--notes",
-                    "Track ready",
-                ],
-            )
-
-            assert result.exit_code == 0
 
-            # Verify all fields were updated
-            updated_car = repo.get_car(car.id)
-            assert updated_car.vin == "JF1ZNAA19H9706029"
-            assert updated_car.nickname == "Track Beast"
-            assert updated_car.current_odometer == 50000
-            assert updated_car.notes == "Track ready"
+        # Verify all fields were updated
+        updated_car = repo.get_car(car.id)
+        assert updated_car.vin == "JF1ZNAA12H9701234"
+        assert updated_car.nickname == "Track Beast"
+        assert updated_car.current_odometer == 50000
+        assert updated_car.notes == "Track ready"
 
-    def test_update_car_not_found(self, temp_db):
+    def test_update_car_not_found(self, class_temp_db):
         """Test updating a non-existent car."""
-        db_path, repo = temp_db
-
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
+        result = runner.invoke(app, ["update-car", "999", "--vin", "TEST123"])
 
-            result = runner.invoke(app, ["update-car", "999", "--vin", "TEST123"])
+        assert result.exit_code != 0
+        assert _NOT_FOUND_RE.search(result.stdout)
 
-            assert result.exit_code != 0
-            assert "not found" in result.stdout.lower() or "Error" in result.stdout
-
-    def test_update_car_no_fields(self, temp_db):
+    def test_update_car_no_fields(self, class_temp_db):
         """Test update-car with no fields specified."""
-        db_path, repo = temp_db
-
-        # Add test car
-        car = Car(
-            year=2017,
-            make="Toyota",
-            model="86",
-            usage_type=UsageType.TRACK,
-        )
-        car = repo.add_car(car)
-
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
+        _, _, car = class_temp_db
 
-            result = runner.invoke(app, ["update-car", str(car.id)])
+        result = runner.invoke(app, ["update-car", str(car.id)])
 
-            assert result.exit_code == 0
-            assert "no fields" in result.stdout.lower()
+        assert result.exit_code == 0
+        assert "no fields" in result.stdout.lower()
 
 
 class TestRemoveCar:
     """Test remove-car command."""
 
-    def test_remove_car_with_confirmation(self, temp_db):
-        """Test removing a car with confirmation."""
-        db_path, repo = temp_db
+    @pytest.mark.parametrize(
+        "argv,input_,expected,deleted",
+        [
+            ([], b"y\n", "deleted successfully", True),
+            (["--force"], None, "deleted successfully", True),
+            ([], b"n\n", "cancelled", False),
+        ],
+        ids=["confirmed", "force", "cancelled"],
+    )
+    def test_remove_car(self, toyota_86, argv, input_, expected, deleted):
+        """Test removing a car via confirmation prompt, --force, or cancelling."""
+        _, repo, car = toyota_86
+
+        result = runner.invoke(app, ["remove-car", str(car.id), *argv], input=input_)
 
-        # Add test car
-        car = Car(
-            year=2017,
-            make="Toyota",
-            model="86",
-            usage_type=UsageType.TRACK,
-        )
-        car = repo.add_car(car)
-
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            # Simulate user confirming deletion
-            result = runner.invoke(app, ["remove-car", str(car.id)], input="y\n")
-
-            assert result.exit_code == 0
-            assert "deleted successfully" in result.stdout.lower()
-
-            # Verify car was deleted
-            deleted_car = repo.get_car(car.id)
-            assert deleted_car is None
-
-    def test_remove_car_with_force(self, temp_db):
-        """Test removing a car with --force flag."""
-        db_path, repo = temp_db
-
-        # Add test car
-        car = Car(
-            year=2017,
-            make="Toyota",
-            model="86",
-            usage_type=UsageType.TRACK,
-        )
-        car = repo.add_car(car)
-
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            result = runner.invoke(app, ["remove-car", str(car.id), "--force"])
-
-            assert result.exit_code == 0
-            assert "deleted successfully" in result.stdout.lower()
-
-            # Verify car was deleted
-            deleted_car = repo.get_car(car.id)
-            assert deleted_car is None
-
-    def test_remove_car_cancel(self, temp_db):
-        """Test cancelling car removal."""
-        db_path, repo = temp_db
-
-        # Add test car
-        car = Car(
-            year=2017,
-            make="Toyota",
-            model="86",
-            usage_type=UsageType.TRACK,
-        )
-        car = repo.add_car(car)
-
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            # Simulate user cancelling deletion
-            result = runner.invoke(app, ["remove-car", str(car.id)], input="n\n")
-
-            assert result.exit_code == 0
-            assert "cancelled" in result.stdout.lower()
+        assert result.exit_code == 0
+        assert expected in result.stdout.lower()
 
-            # Verify car still exists
-            existing_car = repo.get_car(car.id)
-            assert existing_car is not None
+        # Verify whether the car still exists
+        assert (repo.get_car(car.id) is None) is deleted
 
-    def test_remove_car_with_maintenance(self, temp_db):
+    def test_remove_car_with_maintenance(self, toyota_86, capsys):
         """Test removing a car that has maintenance history."""
-        db_path, repo = temp_db
-
-        # Add test car
-        car = Car(
-            year=2017,
-            make="Toyota",
-            model="86",
-            usage_type=UsageType.TRACK,
-        )
-        car = repo.add_car(car)
+        _, repo, car = toyota_86
 
         # Add maintenance event
         event = MaintenanceEvent(
@@ -440,33 +341,22 @@ class TestRemoveCar:
         )
         repo.add_maintenance_event(event)
 
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            result = runner.invoke(app, ["remove-car", str(car.id), "--force"])
+        remove_car_cmd(car_id=car.id, force=True)
 
-            assert result.exit_code == 0
-            assert "deleted successfully" in result.stdout.lower()
+        assert _DELETED_RE.search(capsys.readouterr().out)
 
-            # Verify car and maintenance were deleted
-            deleted_car = repo.get_car(car.id)
-            assert deleted_car is None
-            events = repo.get_maintenance_for_car(car.id)
-            assert len(events) == 0
+        # Verify car and maintenance were deleted
+        deleted_car = repo.get_car(car.id)
+        assert deleted_car is None
+        events = repo.get_maintenance_for_car(car.id)
+        assert len(events) == 0
 
     def test_remove_car_not_found(self, temp_db):
         """Test removing a non-existent car."""
-        db_path, repo = temp_db
-
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
+        result = runner.invoke(app, ["remove-car", "999", "--force"])
 
-            result = runner.invoke(app, ["remove-car", "999", "--force"])
-
-            assert result.exit_code != 0
-            assert "not found" in result.stdout.lower() or "Error" in result.stdout
+        assert result.exit_code != 0
+        assert _NOT_FOUND_RE.search(result.stdout)
 
 
 class TestLogService:
@@ -474,61 +364,53 @@ class TestLogService:
 
     def test_log_service_interactive(self, temp_db):
         """Test logging maintenance interactively."""
-        db_path, repo = temp_db
+        _, repo = temp_db
 
         # Add test car
         car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
         added_car = repo.add_car(car)
 
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            result = runner.invoke(
-                app,
-                ["log-service", str(added_car.id), "--service-date", "2024-01-15"],
-                input="oil_change\ny\n50000\nFull synthetic\n",
-            )
+        result = runner.invoke(
+            app,
+            ["log-service", str(added_car.id), "--service-date", "2024-01-15"],
+            input=b"oil_change\ny\n50000\nFull synthetic\n",
+        )
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-            # Verify event was added
-            events = repo.get_maintenance_for_car(added_car.id)
-            assert len(events) == 1
-            assert events[0].service_type == ServiceType.OIL_CHANGE
+        # Verify event was added
+        events = repo.get_maintenance_for_car(added_car.id)
+        assert len(events) == 1
+        assert events[0].service_type == ServiceType.OIL_CHANGE
 
     def test_log_service_with_flags(self, temp_db):
         """Test logging maintenance with command-line flags."""
-        db_path, repo = temp_db
+        _, repo = temp_db
 
         # Add test car
         car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
         added_car = repo.add_car(car)
 
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            result = runner.invoke(
-                app,
-                [
-                    "log-service",
-                    str(added_car.id),
-                    "--service-date",
-                    "2024-01-15",
-                    "--service-type",
-                    "oil_change",
-                    "--odometer",
-                    "50000",
-                ],
-                input="\n",  # Empty description
-            )
+        result = runner.invoke(
+            app,
+            [
+                "log-service",
+                str(added_car.id),
+                "--service-date",
+                "2024-01-15",
+                "--service-type",
+                "oil_change",
+                "--odometer",
+                "50000",
+            ],
+            input=b"\n",  # Empty description
+        )
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-            # Verify event was added
-            events = repo.get_maintenance_for_car(added_car.id)
-            assert len(events) == 1
+        # Verify event was added
+        events = repo.get_maintenance_for_car(added_car.id)
+        assert len(events) == 1
 
 
 class TestHistory:
@@ -536,24 +418,20 @@ class TestHistory:
 
     def test_history_empty(self, temp_db):
         """Test history when no maintenance events exist."""
-        db_path, repo = temp_db
+        _, repo = temp_db
 
         # Add test car
         car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
         added_car = repo.add_car(car)
 
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            result = runner.invoke(app, ["history", str(added_car.id)])
+        result = runner.invoke(app, ["history", str(added_car.id)])
 
-            assert result.exit_code == 0
-            assert "No maintenance" in result.stdout or "empty" in result.stdout.lower()
+        assert result.exit_code == 0
+        assert "No maintenance" in result.stdout or "empty" in result.stdout.lower()
 
     def test_history_with_events(self, temp_db):
         """Test history with maintenance events."""
-        db_path, repo = temp_db
+        _, repo = temp_db
 
         # Add test car and events
         car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
@@ -567,92 +445,75 @@ class TestHistory:
         )
         repo.add_maintenance_event(event)
 
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
+        result = runner.invoke(app, ["history", str(added_car.id)])
 
-            result = runner.invoke(app, ["history", str(added_car.id)])
-
-            assert result.exit_code == 0
-            assert "oil" in result.stdout.lower()
+        assert result.exit_code == 0
+        assert "oil" in result.stdout.lower()
 
 
+@pytest.mark.llm
 class TestLLMCommands:
     """Test LLM-powered commands."""
 
     def test_summary_command(self, temp_db):
         """Test garage summary command."""
-        db_path, repo = temp_db
+        _, repo = temp_db
 
         # Add test data
         car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
         repo.add_car(car)
 
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            with patch("crewchief.cli.generate_garage_summary") as mock_summary:
-                mock_summary.return_value = "Your garage looks great!"
+        with patch("crewchief.cli.generate_garage_summary") as mock_summary:
+            mock_summary.return_value = "Your garage looks great!"
 
-                result = runner.invoke(app, ["summary"])
+            result = runner.invoke(app, ["summary"])
 
-                assert result.exit_code == 0
-                assert "garage" in result.stdout.lower()
+            assert result.exit_code == 0
+            assert "garage" in result.stdout.lower()
 
     def test_summary_llm_unavailable(self, temp_db):
         """Test summary command when LLM is unavailable."""
-        db_path, repo = temp_db
+        _, repo = temp_db
 
         # Add a car so the command actually tries to generate a summary
         car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
         repo.add_car(car)
 
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            with patch("crewchief.cli.generate_garage_summary") as mock_summary:
-                from crewchief.llm import LLMUnavailableError
-
-                mock_summary.side_effect = LLMUnavailableError("LLM not running")
+        with patch("crewchief.cli.generate_garage_summary") as mock_summary:
+            mock_summary.side_effect = LLMUnavailableError("LLM not running")
 
-                result = runner.invoke(app, ["summary"])
+            result = runner.invoke(app, ["summary"])
 
-                assert result.exit_code != 0
-                assert "unavailable" in result.stdout.lower() or "error" in result.stdout.lower()
+            assert result.exit_code != 0
+            assert _UNAVAILABLE_RE.search(result.stdout)
 
     def test_suggest_maint_command(self, temp_db):
         """Test maintenance suggestions command."""
-        db_path, repo = temp_db
+        _, repo = temp_db
 
         # Add test data
         car = Car(id=1, year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
         repo.add_car(car)
 
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            with patch("crewchief.cli.generate_maintenance_suggestions") as mock_suggest:
-                mock_suggest.return_value = [
-                    MaintenanceSuggestion(
-                        car_id=1,
-                        car_label="2020 Honda Civic",
-                        suggested_actions=["Check oil"],
-                        priority=Priority.MEDIUM,
-                        reasoning="Regular maintenance",
-                    )
-                ]
+        with patch("crewchief.cli.generate_maintenance_suggestions") as mock_suggest:
+            mock_suggest.return_value = [
+                MaintenanceSuggestion(
+                    car_id=1,
+                    car_label="2020 Honda Civic",
+                    suggested_actions=["Check oil"],
+                    priority=Priority.MEDIUM,
+                    reasoning="Regular maintenance",
+                )
+            ]
 
-                result = runner.invoke(app, ["suggest-maint"])
+            result = runner.invoke(app, ["suggest-maint"])
 
-                assert result.exit_code == 0
-                assert "Honda" in result.stdout or "maintenance" in result.stdout.lower()
+            assert result.exit_code == 0
+            assert "Honda" in result.stdout or "maintenance" in result.stdout.lower()
 
     def test_track_prep_command(self, temp_db):
         """Test track prep command."""
-        db_path, repo = temp_db
+        _, repo = temp_db
 
         # Add test car
         car = Car(
@@ -660,36 +521,21 @@ class TestLLMCommands:
         )
         added_car = repo.add_car(car)
 
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
-
-            with patch("crewchief.cli.generate_track_prep_checklist") as mock_checklist:
-                mock_checklist.return_value = TrackPrepChecklist(
-                    car_label="2024 Porsche 911 GT3",
-                    critical_items=["Check brakes"],
-                    recommended_items=["Set tire pressure"],
-                )
+        with patch("crewchief.cli.generate_track_prep_checklist") as mock_checklist:
+            mock_checklist.return_value = TrackPrepChecklist(
+                car_label="2024 Porsche 911 GT3",
+                critical_items=["Check brakes"],
+                recommended_items=["Set tire pressure"],
+            )
 
-                result = runner.invoke(app, ["track-prep", str(added_car.id)])
+            result = runner.invoke(app, ["track-prep", str(added_car.id)])
 
-                assert result.exit_code == 0
-                assert "brake" in result.stdout.lower() or "tire" in result.stdout.lower()
+            assert result.exit_code == 0
+            assert "brake" in result.stdout.lower() or "tire" in result.stdout.lower()
 
     def test_track_prep_car_not_found(self, temp_db):
         """Test track prep with non-existent car."""
-        db_path, _ = temp_db
-
-        with patch("crewchief.cli.get_settings") as mock_settings:
-            settings_mock = create_settings_mock(db_path)
-            mock_settings.return_value = settings_mock
+        result = runner.invoke(app, ["track-prep", "999"])
 
-            result = runner.invoke(app, ["track-prep", "999"])
-
-            if result.exit_code == 0:
-                print(f"\nExit code: {result.exit_code}")
-                print(f"stdout: {result.stdout}")
-                if result.exception:
-                    print(f"Exception: {result.exception}")
-            assert result.exit_code != 0
-            assert "not found" in result.stdout.lower() or "error" in result.stdout.lower()
+        assert result.exit_code != 0
+        assert _NOT_FOUND_RE.search(result.stdout)
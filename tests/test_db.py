@@ -1,20 +1,34 @@
 """Tests for database repository layer."""
 
+import sqlite3
+import weakref
 from datetime import date, datetime
+from uuid import uuid4
 
 import pytest
 
 from crewchief.db import GarageRepository
 from crewchief.models import Car, MaintenanceEvent, ServiceType, UsageType
 
+# Prebuilt once without validation; tests take cheap copies via model_copy()
+_CIVIC = Car.model_construct(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+_GT3 = Car.model_construct(year=2024, make="Porsche", model="911 GT3", usage_type=UsageType.TRACK)
+
 
 @pytest.fixture
-def repo():
-    """Create an in-memory database repository for testing."""
-    repository = GarageRepository(":memory:")
-    repository.init_db()
-    yield repository
-    repository.close()
+def repo(schema_template):
+    """Create an in-memory database repository for testing.
+
+    Each test gets its own named shared-cache database; the connection is closed
+    by a finalizer when the repository is garbage collected rather than in a
+    teardown step. test_connection_management keeps a plain ":memory:" repository
+    to exercise the explicit close() lifecycle.
+    """
+    repository = GarageRepository(f"file:testdb_{uuid4().hex}?mode=memory&cache=shared")
+    conn = repository._get_connection()
+    schema_template.backup(conn)
+    weakref.finalize(repository, conn.close)
+    return repository
 
 
 class TestGarageRepository:
@@ -37,38 +51,36 @@ class TestGarageRepository:
         )
         assert cursor.fetchone() is not None
 
-    def test_add_car_minimal(self, repo):
-        """Test adding a car with minimal fields."""
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
-        result = repo.add_car(car)
-
-        assert result.id is not None
-        assert result.year == 2020
-        assert result.make == "Honda"
-        assert result.model == "Civic"
-        assert result.usage_type == UsageType.DAILY
-
-    def test_add_car_full(self, repo):
-        """Test adding a car with all fields."""
-        car = Car(
-            nickname="Daily Driver",
-            year=2020,
-            make="Honda",
-            model="Civic",
-            trim="Si",
-            vin="1HGBH41JXMN109186",
-            usage_type=UsageType.DAILY,
-            current_odometer=50000,
-            notes="Great condition",
-        )
-        result = repo.add_car(car)
+    @pytest.mark.parametrize(
+        "car_kwargs",
+        [
+            {"year": 2020, "make": "Honda", "model": "Civic", "usage_type": UsageType.DAILY},
+            {
+                "nickname": "Daily Driver",
+                "year": 2020,
+                "make": "Honda",
+                "model": "Civic",
+                "trim": "Si",
+                "vin": "1HGBH41JXMN109186",
+                "usage_type": UsageType.DAILY,
+                "current_odometer": 50000,
+                "notes": "Great condition",
+            },
+        ],
+        ids=["minimal", "full"],
+    )
+    def test_add_car(self, repo, car_kwargs):
+        """Test adding a car and reading every field back from its row."""
+        added = repo.add_car(Car(**car_kwargs))
+        retrieved = repo.get_car(added.id)
 
-        assert result.id is not None
-        assert result.nickname == "Daily Driver"
-        assert result.trim == "Si"
-        assert result.vin == "1HGBH41JXMN109186"
-        assert result.current_odometer == 50000
-        assert result.notes == "Great condition"
+        assert added.id is not None
+        assert retrieved.id == added.id
+        for field, value in car_kwargs.items():
+            assert getattr(added, field) == value
+            assert getattr(retrieved, field) == value
+        assert isinstance(retrieved.created_at, datetime)
+        assert isinstance(retrieved.updated_at, datetime)
 
     def test_get_cars_empty(self, repo):
         """Test getting cars from empty database."""
@@ -77,22 +89,49 @@ class TestGarageRepository:
 
     def test_get_cars_multiple(self, repo):
         """Test getting multiple cars."""
-        car1 = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
-        car2 = Car(
-            year=2024, make="Porsche", model="911 GT3", usage_type=UsageType.TRACK
-        )
+        car1 = _CIVIC.model_copy()
+        car2 = _GT3.model_copy()
 
-        repo.add_car(car1)
-        repo.add_car(car2)
+        with repo.transaction():
+            repo.add_car(car1)
+            repo.add_car(car2)
 
         cars = repo.get_cars()
         assert len(cars) == 2
         assert cars[0].make == "Honda"
         assert cars[1].make == "Porsche"
 
+    def test_add_cars_batch(self, repo):
+        """Test adding several cars in one batch assigns matching IDs."""
+        repo.add_car(Car(year=2017, make="Toyota", model="86", usage_type=UsageType.TRACK))
+        cars = [
+            _CIVIC.model_copy(),
+            _GT3.model_copy(),
+        ]
+
+        result = repo.add_cars(cars)
+
+        assert [car.id for car in result] == [2, 3]
+        assert repo.get_car(result[0].id).make == "Honda"
+        assert repo.get_car(result[1].id).make == "Porsche"
+
+    def test_add_cars_batch_failure_rolls_back(self, repo):
+        """Test that a NOT NULL violation also discards the cars inserted before it."""
+        # model_construct skips validation so the NOT NULL make reaches SQLite
+        invalid = Car.model_construct(
+            year=2020, make=None, model="Civic", usage_type=UsageType.DAILY
+        )
+
+        with pytest.raises(sqlite3.IntegrityError):
+            repo.add_cars([_CIVIC.model_copy(), invalid])
+
+        # The Civic must not resurface when the next write commits
+        repo.add_car(_GT3.model_copy())
+        assert [car.make for car in repo.get_cars()] == ["Porsche"]
+
     def test_get_car_by_id(self, repo):
         """Test getting a specific car by ID."""
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy()
         added = repo.add_car(car)
 
         retrieved = repo.get_car(added.id)
@@ -131,7 +170,7 @@ class TestGarageRepository:
     def test_add_maintenance_event(self, repo):
         """Test adding a maintenance event."""
         # Add a car first
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy()
         added_car = repo.add_car(car)
 
         # Add maintenance event
@@ -152,7 +191,7 @@ class TestGarageRepository:
 
     def test_get_maintenance_for_car_empty(self, repo):
         """Test getting maintenance events for a car with no events."""
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy()
         added_car = repo.add_car(car)
 
         events = repo.get_maintenance_for_car(added_car.id)
@@ -161,7 +200,7 @@ class TestGarageRepository:
     def test_get_maintenance_for_car_multiple(self, repo):
         """Test getting multiple maintenance events for a car."""
         # Add a car
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy()
         added_car = repo.add_car(car)
 
         # Add multiple events
@@ -176,8 +215,9 @@ class TestGarageRepository:
             service_type=ServiceType.TIRES,
         )
 
-        repo.add_maintenance_event(event1)
-        repo.add_maintenance_event(event2)
+        with repo.transaction():
+            repo.add_maintenance_event(event1)
+            repo.add_maintenance_event(event2)
 
         events = repo.get_maintenance_for_car(added_car.id)
         assert len(events) == 2
@@ -188,22 +228,69 @@ class TestGarageRepository:
     def test_get_maintenance_for_car_with_limit(self, repo):
         """Test getting maintenance events with a limit."""
         # Add a car
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy()
         added_car = repo.add_car(car)
 
         # Add three events
-        for i in range(3):
-            event = MaintenanceEvent(
-                car_id=added_car.id,
-                service_date=date(2024, 1, 10 + i),
-                service_type=ServiceType.OIL_CHANGE,
-            )
-            repo.add_maintenance_event(event)
+        repo.add_maintenance_events(
+            [
+                MaintenanceEvent(
+                    car_id=added_car.id,
+                    service_date=date(2024, 1, 10 + i),
+                    service_type=ServiceType.OIL_CHANGE,
+                )
+                for i in range(3)
+            ]
+        )
 
         # Get only the most recent 2
         events = repo.get_maintenance_for_car(added_car.id, limit=2)
         assert len(events) == 2
 
+    def test_add_maintenance_events_batch(self, repo):
+        """Test adding several maintenance events in one call."""
+        added_car = repo.add_car(_CIVIC.model_copy())
+        events = [
+            MaintenanceEvent(
+                car_id=added_car.id,
+                service_date=date(2024, 1, 15),
+                service_type=ServiceType.OIL_CHANGE,
+            ),
+            MaintenanceEvent(
+                car_id=added_car.id,
+                service_date=date(2024, 2, 20),
+                service_type=ServiceType.BRAKES,
+            ),
+        ]
+
+        result = repo.add_maintenance_events(events)
+
+        assert [event.id for event in result] == [1, 2]
+        assert repo.get_maintenance_event(result[1].id).service_type == ServiceType.BRAKES
+
+    def test_add_maintenance_events_batch_failure_rolls_back(self, repo):
+        """Test that an event for an unknown car rolls back the valid event before it."""
+        added_car = repo.add_car(_CIVIC.model_copy())
+        events = [
+            MaintenanceEvent(
+                car_id=added_car.id,
+                service_date=date(2024, 1, 15),
+                service_type=ServiceType.OIL_CHANGE,
+            ),
+            # Violates the car_id foreign key
+            MaintenanceEvent(
+                car_id=999,
+                service_date=date(2024, 2, 20),
+                service_type=ServiceType.BRAKES,
+            ),
+        ]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            repo.add_maintenance_events(events)
+
+        repo.add_car(_GT3.model_copy())
+        assert repo.get_maintenance_for_car(added_car.id) == []
+
     def test_get_all_maintenance_empty(self, repo):
         """Test getting all maintenance events from empty database."""
         events = repo.get_all_maintenance()
@@ -212,10 +299,8 @@ class TestGarageRepository:
     def test_get_all_maintenance_multiple_cars(self, repo):
         """Test getting all maintenance events across multiple cars."""
         # Add two cars
-        car1 = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
-        car2 = Car(
-            year=2024, make="Porsche", model="911 GT3", usage_type=UsageType.TRACK
-        )
+        car1 = _CIVIC.model_copy()
+        car2 = _GT3.model_copy()
         added_car1 = repo.add_car(car1)
         added_car2 = repo.add_car(car2)
 
@@ -243,22 +328,27 @@ class TestGarageRepository:
     def test_get_all_maintenance_with_limit(self, repo):
         """Test getting all maintenance events with a limit."""
         # Add a car
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy()
         added_car = repo.add_car(car)
 
         # Add five events
-        for i in range(5):
-            event = MaintenanceEvent(
-                car_id=added_car.id,
-                service_date=date(2024, 1, 10 + i),
-                service_type=ServiceType.OIL_CHANGE,
-            )
-            repo.add_maintenance_event(event)
+        repo._raw_insert_maintenance(
+            [(added_car.id, f"2024-01-{10 + i}", ServiceType.OIL_CHANGE.value) for i in range(5)]
+        )
 
         # Get only the most recent 3
         events = repo.get_all_maintenance(limit=3)
         assert len(events) == 3
 
+    def test_transaction_rollback(self, repo):
+        """Test that a failed transaction discards every write made inside it."""
+        with pytest.raises(RuntimeError):
+            with repo.transaction():
+                repo.add_car(_CIVIC.model_copy())
+                raise RuntimeError("abort")
+
+        assert repo.get_cars() == []
+
     def test_connection_management(self):
         """Test connection lifecycle."""
         # Create a fresh repo without using the fixture
@@ -276,40 +366,47 @@ class TestGarageRepository:
         test_repo.close()
         assert test_repo.conn is None
 
-    def test_row_to_car_conversion(self, repo):
-        """Test that database rows are correctly converted to Car models."""
-        car = Car(
-            nickname="Test",
-            year=2020,
-            make="Honda",
-            model="Civic",
-            trim="Si",
-            vin="1HGBH41JXMN109186",
-            usage_type=UsageType.DAILY,
-            current_odometer=50000,
-            notes="Test notes",
-        )
-        added = repo.add_car(car)
+    def test_connection_reused_across_calls(self, repo):
+        """Test that repeated queries run on the same long-lived connection."""
+        added = repo.add_car(_CIVIC.model_copy())
+        conn = repo.conn
 
-        # Retrieve and verify all fields
-        retrieved = repo.get_car(added.id)
-        assert retrieved.id == added.id
-        assert retrieved.nickname == "Test"
-        assert retrieved.year == 2020
-        assert retrieved.make == "Honda"
-        assert retrieved.model == "Civic"
-        assert retrieved.trim == "Si"
-        assert retrieved.vin == "1HGBH41JXMN109186"
-        assert retrieved.usage_type == UsageType.DAILY
-        assert retrieved.current_odometer == 50000
-        assert retrieved.notes == "Test notes"
-        assert isinstance(retrieved.created_at, datetime)
-        assert isinstance(retrieved.updated_at, datetime)
+        for _ in range(100):
+            assert repo.get_car(added.id) is not None
+
+        assert repo.conn is conn
+
+    def test_file_backed_pragmas(self, tmp_path):
+        """Test that file-backed databases are opened in WAL mode."""
+        file_repo = GarageRepository(tmp_path / "garage.db")
+        conn = file_repo._get_connection()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+        file_repo.close()
+
+    def test_shared_memory_uri(self):
+        """Test that repositories on the same shared-cache URI see the same data."""
+        uri = f"file:test_{uuid4().hex}?mode=memory&cache=shared"
+        writer = GarageRepository(uri)
+        reader = GarageRepository(uri)
+        writer.init_db()
+
+        writer.add_car(_CIVIC.model_copy())
+
+        cars = reader.get_cars()
+        assert len(cars) == 1
+        assert cars[0].make == "Honda"
+
+        reader.close()
+        writer.close()
 
     def test_row_to_maintenance_event_conversion(self, repo):
         """Test that database rows are correctly converted to MaintenanceEvent models."""
         # Add a car first
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy()
         added_car = repo.add_car(car)
 
         # Add maintenance event with all fields
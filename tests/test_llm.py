@@ -2,7 +2,7 @@
 
 import json
 from datetime import date, datetime
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import httpx
 import pytest
@@ -12,6 +12,8 @@ from crewchief.llm import (
     LLMError,
     LLMResponseError,
     LLMUnavailableError,
+    _get_client,
+    close_client,
     generate_garage_summary,
     generate_maintenance_suggestions,
     generate_track_prep_checklist,
@@ -28,70 +30,102 @@ from crewchief.models import (
     UsageType,
 )
 
+# Prebuilt once without validation; tests take cheap copies via model_copy()
+_CIVIC = Car.model_construct(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+_GT3 = Car.model_construct(year=2024, make="Porsche", model="911 GT3", usage_type=UsageType.TRACK)
+
+# Canned LLM message contents, serialized once at import
+_VALID_TRACK_JSON = json.dumps(
+    {
+        "car_label": "2020 Honda Civic",
+        "critical_items": ["Check brakes"],
+        "recommended_items": ["Set tire pressure"],
+    }
+)
+_INVALID_SCHEMA_JSON = json.dumps({"invalid_field": "value"})
+_VALID_SUGGESTIONS_JSON = json.dumps(
+    [
+        {
+            "car_id": 1,
+            "car_label": "2020 Honda Civic",
+            "suggested_actions": ["Check oil", "Inspect tires"],
+            "priority": "medium",
+            "reasoning": "Regular maintenance needed",
+        }
+    ]
+)
+_NOT_ARRAY_JSON = json.dumps({"not": "an array"})
+_INVALID_SUGGESTIONS_JSON = json.dumps([{"invalid": "schema"}])
+
+
+class _FakeClient:
+    """Minimal stand-in for the shared httpx.Client used by llm_chat.
+
+    post() returns the canned result, or raises it if it is an exception.
+    """
+
+    def __init__(self, result=None):
+        self.result = result
+        self.post_calls = 0
+
+    def post(self, *args, **kwargs):
+        self.post_calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def _chat_response(content):
+    """Build a mock HTTP response carrying one chat completion message."""
+    response = Mock()
+    response.json.return_value = {"choices": [{"message": {"content": content}}]}
+    return response
+
+
+def _error_response(status_code, text):
+    """Build a mock HTTP response whose raise_for_status() raises HTTPStatusError."""
+    response = Mock(status_code=status_code, text=text)
+    response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "Server error", request=Mock(), response=response
+    )
+    return response
+
+
+@pytest.fixture(scope="module")
+def llm_settings():
+    """Settings stub with the LLM enabled, shared by the llm_chat tests."""
+    return Mock(
+        llm_enabled=True,
+        llm_base_url="http://localhost:1234/v1",
+        llm_model="test-model",
+        llm_timeout=30,
+    )
+
 
 class TestLLMChat:
     """Test the core llm_chat function."""
 
-    @patch("crewchief.llm.httpx.Client")
-    @patch("crewchief.llm.get_settings")
-    def test_llm_chat_string_response(self, mock_settings, mock_client):
-        """Test LLM chat with a string response."""
-        # Mock settings
-        mock_settings.return_value = Mock(
-            llm_enabled=True,
-            llm_base_url="http://localhost:1234/v1",
-            llm_model="test-model",
-            llm_timeout=30,
-        )
-
-        # Mock HTTP response
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Test response from LLM"}}]
-        }
-        mock_response.raise_for_status = Mock()
+    @pytest.fixture(autouse=True)
+    def fake_client(self, monkeypatch, llm_settings):
+        """Point llm_chat at the enabled settings stub and a fake HTTP client."""
+        client = _FakeClient()
+        monkeypatch.setattr("crewchief.llm.get_settings", lambda: llm_settings)
+        monkeypatch.setattr("crewchief.llm._get_client", lambda: client)
+        return client
 
-        # Mock client context manager
-        mock_client_instance = MagicMock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client.return_value.__enter__.return_value = mock_client_instance
+    def test_llm_chat_string_response(self, fake_client):
+        """Test LLM chat with a string response."""
+        fake_client.result = _chat_response("Test response from LLM")
 
-        # Call llm_chat
         result = llm_chat("System prompt", "User prompt")
 
         assert result == "Test response from LLM"
-        mock_client_instance.post.assert_called_once()
+        assert fake_client.post_calls == 1
 
-    @patch("crewchief.llm.httpx.Client")
-    @patch("crewchief.llm.get_settings")
-    def test_llm_chat_with_schema(self, mock_settings, mock_client):
+    def test_llm_chat_with_schema(self, fake_client):
         """Test LLM chat with Pydantic schema validation."""
-        # Mock settings
-        mock_settings.return_value = Mock(
-            llm_enabled=True,
-            llm_base_url="http://localhost:1234/v1",
-            llm_model="test-model",
-            llm_timeout=30,
-        )
+        fake_client.result = _chat_response(_VALID_TRACK_JSON)
 
-        # Mock HTTP response with valid JSON
-        json_response = {
-            "car_label": "2020 Honda Civic",
-            "critical_items": ["Check brakes"],
-            "recommended_items": ["Set tire pressure"],
-        }
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": json.dumps(json_response)}}]
-        }
-        mock_response.raise_for_status = Mock()
-
-        # Mock client
-        mock_client_instance = MagicMock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client.return_value.__enter__.return_value = mock_client_instance
-
-        # Call with schema
         result = llm_chat(
             "System prompt", "User prompt", response_schema=TrackPrepChecklist
         )
@@ -100,132 +134,50 @@ class TestLLMChat:
         assert result.car_label == "2020 Honda Civic"
         assert len(result.critical_items) == 1
 
-    @patch("crewchief.llm.get_settings")
-    def test_llm_chat_disabled(self, mock_settings):
+    def test_llm_chat_disabled(self, monkeypatch):
         """Test that llm_chat raises error when LLM is disabled."""
-        mock_settings.return_value = Mock(llm_enabled=False)
+        monkeypatch.setattr("crewchief.llm.get_settings", lambda: Mock(llm_enabled=False))
 
         with pytest.raises(LLMUnavailableError) as exc_info:
             llm_chat("System", "User")
 
         assert "disabled in settings" in str(exc_info.value)
 
-    @patch("crewchief.llm.httpx.Client")
-    @patch("crewchief.llm.get_settings")
-    def test_llm_chat_connection_error(self, mock_settings, mock_client):
-        """Test handling of connection errors."""
-        mock_settings.return_value = Mock(
-            llm_enabled=True,
-            llm_base_url="http://localhost:1234/v1",
-            llm_model="test-model",
-            llm_timeout=30,
-        )
-
-        # Mock connection error
-        mock_client_instance = MagicMock()
-        mock_client_instance.post.side_effect = httpx.ConnectError("Connection refused")
-        mock_client.return_value.__enter__.return_value = mock_client_instance
-
-        with pytest.raises(LLMUnavailableError) as exc_info:
-            llm_chat("System", "User")
-
-        assert "Cannot connect" in str(exc_info.value)
-
-    @patch("crewchief.llm.httpx.Client")
-    @patch("crewchief.llm.get_settings")
-    def test_llm_chat_timeout_error(self, mock_settings, mock_client):
-        """Test handling of timeout errors."""
-        mock_settings.return_value = Mock(
-            llm_enabled=True,
-            llm_base_url="http://localhost:1234/v1",
-            llm_model="test-model",
-            llm_timeout=30,
-        )
-
-        # Mock timeout
-        mock_client_instance = MagicMock()
-        mock_client_instance.post.side_effect = httpx.TimeoutException("Timeout")
-        mock_client.return_value.__enter__.return_value = mock_client_instance
-
-        with pytest.raises(LLMUnavailableError) as exc_info:
+    @pytest.mark.parametrize(
+        "result, err_cls, substr",
+        [
+            (httpx.ConnectError("Connection refused"), LLMUnavailableError, "Cannot connect"),
+            (httpx.TimeoutException("Timeout"), LLMUnavailableError, "timed out"),
+            (_error_response(500, "Internal server error"), LLMResponseError, "500"),
+        ],
+        ids=["connection", "timeout", "http_status"],
+    )
+    def test_llm_chat_error_paths(self, fake_client, result, err_cls, substr):
+        """Test that transport and HTTP errors map to the right LLM errors.
+
+        Transport errors are raised by post(); the HTTP status error comes from
+        raise_for_status() on the returned response, as with a real server.
+        """
+        fake_client.result = result
+
+        with pytest.raises(err_cls) as exc_info:
             llm_chat("System", "User")
 
-        assert "timed out" in str(exc_info.value)
-
-    @patch("crewchief.llm.httpx.Client")
-    @patch("crewchief.llm.get_settings")
-    def test_llm_chat_http_error(self, mock_settings, mock_client):
-        """Test handling of HTTP status errors."""
-        mock_settings.return_value = Mock(
-            llm_enabled=True,
-            llm_base_url="http://localhost:1234/v1",
-            llm_model="test-model",
-            llm_timeout=30,
-        )
+        assert substr in str(exc_info.value)
 
-        # Mock HTTP error
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal server error"
-        mock_client_instance = MagicMock()
-        mock_client_instance.post.return_value = mock_response
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Server error", request=Mock(), response=mock_response
-        )
-        mock_client.return_value.__enter__.return_value = mock_client_instance
-
-        with pytest.raises(LLMResponseError) as exc_info:
-            llm_chat("System", "User")
-
-        assert "500" in str(exc_info.value)
-
-    @patch("crewchief.llm.httpx.Client")
-    @patch("crewchief.llm.get_settings")
-    def test_llm_chat_invalid_response_format(self, mock_settings, mock_client):
+    def test_llm_chat_invalid_response_format(self, fake_client):
         """Test handling of invalid response format."""
-        mock_settings.return_value = Mock(
-            llm_enabled=True,
-            llm_base_url="http://localhost:1234/v1",
-            llm_model="test-model",
-            llm_timeout=30,
-        )
-
-        # Mock invalid response
-        mock_response = Mock()
-        mock_response.json.return_value = {"invalid": "structure"}
-        mock_response.raise_for_status = Mock()
-
-        mock_client_instance = MagicMock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client.return_value.__enter__.return_value = mock_client_instance
+        fake_client.result = Mock()
+        fake_client.result.json.return_value = {"invalid": "structure"}
 
         with pytest.raises(LLMResponseError) as exc_info:
             llm_chat("System", "User")
 
         assert "Invalid response format" in str(exc_info.value)
 
-    @patch("crewchief.llm.httpx.Client")
-    @patch("crewchief.llm.get_settings")
-    def test_llm_chat_schema_validation_failure(self, mock_settings, mock_client):
+    def test_llm_chat_schema_validation_failure(self, fake_client):
         """Test handling of schema validation failure."""
-        mock_settings.return_value = Mock(
-            llm_enabled=True,
-            llm_base_url="http://localhost:1234/v1",
-            llm_model="test-model",
-            llm_timeout=30,
-        )
-
-        # Mock response with invalid schema
-        json_response = {"invalid_field": "value"}
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": json.dumps(json_response)}}]
-        }
-        mock_response.raise_for_status = Mock()
-
-        mock_client_instance = MagicMock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client.return_value.__enter__.return_value = mock_client_instance
+        fake_client.result = _chat_response(_INVALID_SCHEMA_JSON)
 
         with pytest.raises(LLMResponseError) as exc_info:
             llm_chat(
@@ -235,6 +187,20 @@ class TestLLMChat:
         assert "does not match expected schema" in str(exc_info.value)
 
 
+class TestSharedClient:
+    """Test the module-level HTTP client used by llm_chat."""
+
+    def test_shared_client_reused(self):
+        """Test that llm_chat calls share one HTTP client until it is closed."""
+        client = _get_client()
+        try:
+            assert _get_client() is client
+        finally:
+            close_client()
+
+        assert client.is_closed
+
+
 class TestGenerateGarageSummary:
     """Test garage summary generation."""
 
@@ -243,7 +209,7 @@ class TestGenerateGarageSummary:
         """Test successful garage summary generation."""
         mock_llm_chat.return_value = "Your garage is looking great! You have 2 vehicles."
 
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy()
         snapshot = GarageSnapshot(cars=[car], maintenance_events=[])
 
         result = generate_garage_summary(snapshot)
@@ -257,7 +223,7 @@ class TestGenerateGarageSummary:
         """Test error handling when response is not a string."""
         mock_llm_chat.return_value = {"invalid": "response"}
 
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy()
         snapshot = GarageSnapshot(cars=[car], maintenance_events=[])
 
         with pytest.raises(LLMResponseError) as exc_info:
@@ -272,20 +238,9 @@ class TestGenerateMaintenanceSuggestions:
     @patch("crewchief.llm.llm_chat")
     def test_generate_suggestions_success(self, mock_llm_chat):
         """Test successful maintenance suggestion generation."""
-        mock_response = json.dumps(
-            [
-                {
-                    "car_id": 1,
-                    "car_label": "2020 Honda Civic",
-                    "suggested_actions": ["Check oil", "Inspect tires"],
-                    "priority": "medium",
-                    "reasoning": "Regular maintenance needed",
-                }
-            ]
-        )
-        mock_llm_chat.return_value = mock_response
+        mock_llm_chat.return_value = _VALID_SUGGESTIONS_JSON
 
-        car = Car(id=1, year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy(update={"id": 1})
         snapshot = GarageSnapshot(cars=[car], maintenance_events=[])
 
         result = generate_maintenance_suggestions(snapshot)
@@ -301,7 +256,7 @@ class TestGenerateMaintenanceSuggestions:
         """Test error handling for invalid JSON response."""
         mock_llm_chat.return_value = "Not valid JSON"
 
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy()
         snapshot = GarageSnapshot(cars=[car], maintenance_events=[])
 
         with pytest.raises(LLMResponseError) as exc_info:
@@ -312,9 +267,9 @@ class TestGenerateMaintenanceSuggestions:
     @patch("crewchief.llm.llm_chat")
     def test_generate_suggestions_not_array(self, mock_llm_chat):
         """Test error handling when response is not an array."""
-        mock_llm_chat.return_value = json.dumps({"not": "an array"})
+        mock_llm_chat.return_value = _NOT_ARRAY_JSON
 
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy()
         snapshot = GarageSnapshot(cars=[car], maintenance_events=[])
 
         with pytest.raises(LLMResponseError) as exc_info:
@@ -325,10 +280,9 @@ class TestGenerateMaintenanceSuggestions:
     @patch("crewchief.llm.llm_chat")
     def test_generate_suggestions_invalid_schema(self, mock_llm_chat):
         """Test error handling for schema validation failures."""
-        mock_response = json.dumps([{"invalid": "schema"}])
-        mock_llm_chat.return_value = mock_response
+        mock_llm_chat.return_value = _INVALID_SUGGESTIONS_JSON
 
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+        car = _CIVIC.model_copy()
         snapshot = GarageSnapshot(cars=[car], maintenance_events=[])
 
         with pytest.raises(LLMResponseError) as exc_info:
@@ -351,13 +305,7 @@ class TestGenerateTrackPrepChecklist:
         )
         mock_llm_chat.return_value = mock_checklist
 
-        car = Car(
-            id=1,
-            year=2024,
-            make="Porsche",
-            model="911 GT3",
-            usage_type=UsageType.TRACK,
-        )
+        car = _GT3.model_copy(update={"id": 1})
         event = MaintenanceEvent(
             car_id=1,
             service_date=date(2024, 1, 15),
@@ -376,9 +324,7 @@ class TestGenerateTrackPrepChecklist:
         """Test error handling when response is not TrackPrepChecklist."""
         mock_llm_chat.return_value = "Not a checklist"
 
-        car = Car(
-            year=2024, make="Porsche", model="911 GT3", usage_type=UsageType.TRACK
-        )
+        car = _GT3.model_copy()
 
         with pytest.raises(LLMResponseError) as exc_info:
             generate_track_prep_checklist(car, [])
@@ -395,13 +341,7 @@ class TestGenerateTrackPrepChecklist:
         )
         mock_llm_chat.return_value = mock_checklist
 
-        car = Car(
-            id=1,
-            year=2024,
-            make="Porsche",
-            model="911 GT3",
-            usage_type=UsageType.TRACK,
-        )
+        car = _GT3.model_copy(update={"id": 1})
         events = [
             MaintenanceEvent(
                 car_id=1,
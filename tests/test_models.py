@@ -1,5 +1,6 @@
 """Tests for Pydantic models."""
 
+import re
 from datetime import date, datetime
 
 import pytest
@@ -16,41 +17,144 @@ from crewchief.models import (
     UsageType,
 )
 
+# Fixed timestamps keep inputs deterministic and are built once per module
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+_SERVICE_DATE = date(2024, 1, 15)
+
+# Sample field values shared between inputs and assertions
+_VIN = "1HGBH41JXMN109186"
+_NICKNAME = "Daily Driver"
+_PARTS = "Mobil 1 5W-30, OEM filter"
+_PORSCHE_LABEL = "2020 Porsche 911 GT3"
+
+# Expected list contents for the LLM output models
+_ACTIONS = ("Check tire pressure", "Inspect brake pads")
+_CRITICAL = ("Check brake pads", "Inspect brake fluid")
+_RECOMMENDED = ("Set tire pressures", "Torque wheel nuts")
+
+# Declared field names, read once per model class
+_CAR_FIELDS = tuple(Car.model_fields)
+_EVENT_FIELDS = tuple(MaintenanceEvent.model_fields)
+
+# Field-name patterns matched against ValidationError messages
+_RE_YEAR = re.compile(r"\byear\b")
+_RE_CURRENT_ODOMETER = re.compile(r"\bcurrent_odometer\b")
+_RE_USAGE_TYPE = re.compile(r"\busage_type\b")
+_RE_ODOMETER = re.compile(r"\bodometer\b")
+_RE_COST = re.compile(r"\bcost\b")
+_RE_SERVICE_TYPE = re.compile(r"\bservice_type\b")
+_RE_PRIORITY = re.compile(r"\bpriority\b")
+
+# Empty snapshot validated once at import; treat as read-only
+_EMPTY_SNAPSHOT = GarageSnapshot(cars=(), maintenance_events=())
+
+
+def _as_dict(model, fields: tuple[str, ...]) -> dict:
+    """Read the given fields of a model into a plain dict for one-shot comparison.
+
+    Pass a model's full field tuple so a complete expected dict also flags added or
+    renamed fields.
+    """
+    return {name: getattr(model, name) for name in fields}
+
+
+def _expect_validation_error(build, pattern) -> None:
+    """Assert that build() raises a ValidationError whose message matches pattern."""
+    try:
+        build()
+    except ValidationError as exc:
+        assert pattern.search(str(exc)), f"{pattern.pattern!r} not in {exc}"
+        return
+    raise AssertionError("expected ValidationError")
+
+
+def _missing_fields(exc_info) -> set[str]:
+    """Return the top-level field names reported by a captured ValidationError."""
+    errors = exc_info.value.errors(include_url=False, include_context=False, include_input=False)
+    return {error["loc"][0] for error in errors}
+
+
+@pytest.mark.parametrize(
+    "cls, kwargs, expected",
+    [
+        (Car, {"year": 2020}, {"make", "model", "usage_type"}),
+        (MaintenanceEvent, {"car_id": 1}, {"service_date", "service_type"}),
+        (
+            MaintenanceSuggestion,
+            {"car_id": 1},
+            {"car_label", "suggested_actions", "priority", "reasoning"},
+        ),
+        (
+            TrackPrepChecklist,
+            {"car_label": _PORSCHE_LABEL},
+            {"critical_items", "recommended_items"},
+        ),
+    ],
+    ids=["Car", "MaintenanceEvent", "MaintenanceSuggestion", "TrackPrepChecklist"],
+)
+def test_missing_required_fields(cls, kwargs, expected):
+    """Test that missing required fields raise ValidationError."""
+    with pytest.raises(ValidationError) as exc_info:
+        cls(**kwargs)
+    assert expected <= _missing_fields(exc_info)
+
+
+@pytest.fixture(scope="session")
+def minimal_car():
+    """Validated minimal car shared by read-only tests; do not mutate."""
+    return Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
+
+
+@pytest.fixture(scope="session")
+def minimal_event():
+    """Validated minimal maintenance event shared by read-only tests; do not mutate."""
+    return MaintenanceEvent(
+        car_id=1,
+        service_date=_SERVICE_DATE,
+        service_type=ServiceType.OIL_CHANGE,
+    )
+
+
+_ENUM_VALUES = [
+    (UsageType.DAILY, "daily"),
+    (UsageType.TRACK, "track"),
+    (UsageType.PROJECT, "project"),
+    (UsageType.SHOW, "show"),
+    (UsageType.OTHER, "other"),
+    (ServiceType.OIL_CHANGE, "oil_change"),
+    (ServiceType.BRAKES, "brakes"),
+    (ServiceType.TIRES, "tires"),
+    (ServiceType.FLUIDS, "fluids"),
+    (ServiceType.INSPECTION, "inspection"),
+    (ServiceType.MOD, "mod"),
+    (ServiceType.OTHER, "other"),
+    (Priority.HIGH, "high"),
+    (Priority.MEDIUM, "medium"),
+    (Priority.LOW, "low"),
+]
+
+
+@pytest.mark.parametrize(
+    "member, expected",
+    _ENUM_VALUES,
+    ids=[f"{type(member).__name__}.{member.name}" for member, _ in _ENUM_VALUES],
+)
+def test_enum_value(member, expected):
+    """Test UsageType, ServiceType and Priority members map to their stored values."""
+    assert member == expected
 
-class TestUsageType:
-    """Test UsageType enum."""
-
-    def test_all_values(self):
-        """Test all enum values are accessible."""
-        assert UsageType.DAILY == "daily"
-        assert UsageType.TRACK == "track"
-        assert UsageType.PROJECT == "project"
-        assert UsageType.SHOW == "show"
-        assert UsageType.OTHER == "other"
-
-
-class TestServiceType:
-    """Test ServiceType enum."""
-
-    def test_all_values(self):
-        """Test all enum values are accessible."""
-        assert ServiceType.OIL_CHANGE == "oil_change"
-        assert ServiceType.BRAKES == "brakes"
-        assert ServiceType.TIRES == "tires"
-        assert ServiceType.FLUIDS == "fluids"
-        assert ServiceType.INSPECTION == "inspection"
-        assert ServiceType.MOD == "mod"
-        assert ServiceType.OTHER == "other"
 
+# Expected value set per enum, built at import from the table above
+_ENUM_VALUE_SETS = {
+    enum_cls: frozenset(value for member, value in _ENUM_VALUES if type(member) is enum_cls)
+    for enum_cls in (UsageType, ServiceType, Priority)
+}
 
-class TestPriority:
-    """Test Priority enum."""
 
-    def test_all_values(self):
-        """Test all enum values are accessible."""
-        assert Priority.HIGH == "high"
-        assert Priority.MEDIUM == "medium"
-        assert Priority.LOW == "low"
+@pytest.mark.parametrize("enum_cls", list(_ENUM_VALUE_SETS), ids=lambda cls: cls.__name__)
+def test_enum_has_no_extra_members(enum_cls):
+    """Test each enum defines exactly the values listed in _ENUM_VALUES."""
+    assert frozenset(member.value for member in enum_cls) == _ENUM_VALUE_SETS[enum_cls]
 
 
 class TestCar:
@@ -74,48 +178,36 @@ class TestCar:
         assert car.vin is None
         assert car.current_odometer is None
         assert car.notes is None
-        assert isinstance(car.created_at, datetime)
-        assert isinstance(car.updated_at, datetime)
+        assert type(car.created_at) is datetime
+        assert type(car.updated_at) is datetime
 
     def test_valid_car_full(self):
         """Test creating a car with all fields."""
-        now = datetime.now()
-        car = Car(
-            id=1,
-            nickname="Daily Driver",
-            year=2020,
-            make="Honda",
-            model="Civic",
-            trim="Si",
-            vin="1HGBH41JXMN109186",
-            usage_type=UsageType.DAILY,
-            current_odometer=50000,
-            notes="Great condition",
-            created_at=now,
-            updated_at=now,
-        )
-        assert car.id == 1
-        assert car.nickname == "Daily Driver"
-        assert car.year == 2020
-        assert car.make == "Honda"
-        assert car.model == "Civic"
-        assert car.trim == "Si"
-        assert car.vin == "1HGBH41JXMN109186"
-        assert car.usage_type == UsageType.DAILY
-        assert car.current_odometer == 50000
-        assert car.notes == "Great condition"
-        assert car.created_at == now
-        assert car.updated_at == now
-
-    def test_display_name_without_nickname(self):
+        fields = {
+            "id": 1,
+            "nickname": _NICKNAME,
+            "year": 2020,
+            "make": "Honda",
+            "model": "Civic",
+            "trim": "Si",
+            "vin": _VIN,
+            "usage_type": UsageType.DAILY,
+            "current_odometer": 50000,
+            "notes": "Great condition",
+            "created_at": _FIXED_NOW,
+            "updated_at": _FIXED_NOW,
+        }
+        car = Car(**fields)
+        assert _as_dict(car, _CAR_FIELDS) == fields
+
+    def test_display_name_without_nickname(self, minimal_car):
         """Test display_name() method without nickname."""
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
-        assert car.display_name() == "2020 Honda Civic"
+        assert minimal_car.display_name() == "2020 Honda Civic"
 
     def test_display_name_with_nickname(self):
         """Test display_name() method with nickname."""
         car = Car(
-            nickname="Daily Driver",
+            nickname=_NICKNAME,
             year=2020,
             make="Honda",
             model="Civic",
@@ -125,48 +217,42 @@ class TestCar:
 
     def test_invalid_year_too_low(self):
         """Test year validation rejects values below 1900."""
-        with pytest.raises(ValidationError) as exc_info:
-            Car(year=1899, make="Ford", model="Model T", usage_type=UsageType.OTHER)
-        assert "year" in str(exc_info.value)
+        _expect_validation_error(
+            lambda: Car(year=1899, make="Ford", model="Model T", usage_type=UsageType.OTHER),
+            _RE_YEAR,
+        )
 
     def test_invalid_year_too_high(self):
         """Test year validation rejects values above 2100."""
-        with pytest.raises(ValidationError) as exc_info:
-            Car(year=2101, make="Tesla", model="Cybertruck", usage_type=UsageType.DAILY)
-        assert "year" in str(exc_info.value)
+        _expect_validation_error(
+            lambda: Car(year=2101, make="Tesla", model="Cybertruck", usage_type=UsageType.DAILY),
+            _RE_YEAR,
+        )
 
     def test_invalid_odometer_negative(self):
         """Test odometer validation rejects negative values."""
-        with pytest.raises(ValidationError) as exc_info:
-            Car(
+        _expect_validation_error(
+            lambda: Car(
                 year=2020,
                 make="Honda",
                 model="Civic",
                 usage_type=UsageType.DAILY,
                 current_odometer=-1000,
-            )
-        assert "current_odometer" in str(exc_info.value)
-
-    def test_missing_required_fields(self):
-        """Test that missing required fields raise ValidationError."""
-        with pytest.raises(ValidationError) as exc_info:
-            Car(year=2020)
-        errors = exc_info.value.errors()
-        field_names = [e["loc"][0] for e in errors]
-        assert "make" in field_names
-        assert "model" in field_names
-        assert "usage_type" in field_names
+            ),
+            _RE_CURRENT_ODOMETER,
+        )
 
     def test_invalid_usage_type(self):
         """Test that invalid usage_type raises ValidationError."""
-        with pytest.raises(ValidationError) as exc_info:
-            Car(
+        _expect_validation_error(
+            lambda: Car(
                 year=2020,
                 make="Honda",
                 model="Civic",
                 usage_type="invalid_type",  # type: ignore
-            )
-        assert "usage_type" in str(exc_info.value)
+            ),
+            _RE_USAGE_TYPE,
+        )
 
 
 class TestMaintenanceEvent:
@@ -176,11 +262,11 @@ class TestMaintenanceEvent:
         """Test creating an event with minimal required fields."""
         event = MaintenanceEvent(
             car_id=1,
-            service_date=date(2024, 1, 15),
+            service_date=_SERVICE_DATE,
             service_type=ServiceType.OIL_CHANGE,
         )
         assert event.car_id == 1
-        assert event.service_date == date(2024, 1, 15)
+        assert event.service_date == _SERVICE_DATE
         assert event.service_type == ServiceType.OIL_CHANGE
         assert event.id is None
         assert event.odometer is None
@@ -188,74 +274,59 @@ class TestMaintenanceEvent:
         assert event.parts is None
         assert event.cost is None
         assert event.location is None
-        assert isinstance(event.created_at, datetime)
+        assert type(event.created_at) is datetime
 
     def test_valid_event_full(self):
         """Test creating an event with all fields."""
-        now = datetime.now()
-        event = MaintenanceEvent(
-            id=1,
-            car_id=1,
-            service_date=date(2024, 1, 15),
-            odometer=50000,
-            service_type=ServiceType.OIL_CHANGE,
-            description="Full synthetic oil change",
-            parts="Mobil 1 5W-30, OEM filter",
-            cost=89.99,
-            location="Local Shop",
-            created_at=now,
-        )
-        assert event.id == 1
-        assert event.car_id == 1
-        assert event.service_date == date(2024, 1, 15)
-        assert event.odometer == 50000
-        assert event.service_type == ServiceType.OIL_CHANGE
-        assert event.description == "Full synthetic oil change"
-        assert event.parts == "Mobil 1 5W-30, OEM filter"
-        assert event.cost == 89.99
-        assert event.location == "Local Shop"
-        assert event.created_at == now
+        fields = {
+            "id": 1,
+            "car_id": 1,
+            "service_date": _SERVICE_DATE,
+            "odometer": 50000,
+            "service_type": ServiceType.OIL_CHANGE,
+            "description": "Full synthetic oil change",
+            "parts": _PARTS,
+            "cost": 89.99,
+            "location": "Local Shop",
+            "created_at": _FIXED_NOW,
+        }
+        event = MaintenanceEvent(**fields)
+        assert _as_dict(event, _EVENT_FIELDS) == fields
 
     def test_invalid_odometer_negative(self):
         """Test odometer validation rejects negative values."""
-        with pytest.raises(ValidationError) as exc_info:
-            MaintenanceEvent(
+        _expect_validation_error(
+            lambda: MaintenanceEvent(
                 car_id=1,
-                service_date=date(2024, 1, 15),
+                service_date=_SERVICE_DATE,
                 service_type=ServiceType.OIL_CHANGE,
                 odometer=-100,
-            )
-        assert "odometer" in str(exc_info.value)
+            ),
+            _RE_ODOMETER,
+        )
 
     def test_invalid_cost_negative(self):
         """Test cost validation rejects negative values."""
-        with pytest.raises(ValidationError) as exc_info:
-            MaintenanceEvent(
+        _expect_validation_error(
+            lambda: MaintenanceEvent(
                 car_id=1,
-                service_date=date(2024, 1, 15),
+                service_date=_SERVICE_DATE,
                 service_type=ServiceType.OIL_CHANGE,
                 cost=-50.0,
-            )
-        assert "cost" in str(exc_info.value)
-
-    def test_missing_required_fields(self):
-        """Test that missing required fields raise ValidationError."""
-        with pytest.raises(ValidationError) as exc_info:
-            MaintenanceEvent(car_id=1)
-        errors = exc_info.value.errors()
-        field_names = [e["loc"][0] for e in errors]
-        assert "service_date" in field_names
-        assert "service_type" in field_names
+            ),
+            _RE_COST,
+        )
 
     def test_invalid_service_type(self):
         """Test that invalid service_type raises ValidationError."""
-        with pytest.raises(ValidationError) as exc_info:
-            MaintenanceEvent(
+        _expect_validation_error(
+            lambda: MaintenanceEvent(
                 car_id=1,
-                service_date=date(2024, 1, 15),
+                service_date=_SERVICE_DATE,
                 service_type="invalid_type",  # type: ignore
-            )
-        assert "service_type" in str(exc_info.value)
+            ),
+            _RE_SERVICE_TYPE,
+        )
 
 
 class TestGarageSnapshot:
@@ -263,23 +334,16 @@ class TestGarageSnapshot:
 
     def test_empty_snapshot(self):
         """Test creating an empty garage snapshot."""
-        snapshot = GarageSnapshot(cars=[], maintenance_events=[])
-        assert snapshot.cars == []
-        assert snapshot.maintenance_events == []
+        assert _EMPTY_SNAPSHOT.cars == []
+        assert _EMPTY_SNAPSHOT.maintenance_events == []
 
-    def test_snapshot_with_data(self):
+    def test_snapshot_with_data(self, minimal_car, minimal_event):
         """Test creating a snapshot with cars and events."""
-        car = Car(year=2020, make="Honda", model="Civic", usage_type=UsageType.DAILY)
-        event = MaintenanceEvent(
-            car_id=1,
-            service_date=date(2024, 1, 15),
-            service_type=ServiceType.OIL_CHANGE,
-        )
-        snapshot = GarageSnapshot(cars=[car], maintenance_events=[event])
+        snapshot = GarageSnapshot(cars=[minimal_car], maintenance_events=[minimal_event])
         assert len(snapshot.cars) == 1
         assert len(snapshot.maintenance_events) == 1
-        assert snapshot.cars[0] == car
-        assert snapshot.maintenance_events[0] == event
+        assert snapshot.cars[0] == minimal_car
+        assert snapshot.maintenance_events[0] == minimal_event
 
 
 class TestMaintenanceSuggestion:
@@ -290,38 +354,28 @@ class TestMaintenanceSuggestion:
         suggestion = MaintenanceSuggestion(
             car_id=1,
             car_label="2020 Honda Civic",
-            suggested_actions=["Check tire pressure", "Inspect brake pads"],
+            suggested_actions=_ACTIONS,
             priority=Priority.MEDIUM,
             reasoning="Regular maintenance items for this mileage",
         )
         assert suggestion.car_id == 1
         assert suggestion.car_label == "2020 Honda Civic"
-        assert len(suggestion.suggested_actions) == 2
+        assert tuple(suggestion.suggested_actions) == _ACTIONS
         assert suggestion.priority == Priority.MEDIUM
         assert "Regular maintenance" in suggestion.reasoning
 
-    def test_missing_required_fields(self):
-        """Test that missing required fields raise ValidationError."""
-        with pytest.raises(ValidationError) as exc_info:
-            MaintenanceSuggestion(car_id=1)
-        errors = exc_info.value.errors()
-        field_names = [e["loc"][0] for e in errors]
-        assert "car_label" in field_names
-        assert "suggested_actions" in field_names
-        assert "priority" in field_names
-        assert "reasoning" in field_names
-
     def test_invalid_priority(self):
         """Test that invalid priority raises ValidationError."""
-        with pytest.raises(ValidationError) as exc_info:
-            MaintenanceSuggestion(
+        _expect_validation_error(
+            lambda: MaintenanceSuggestion(
                 car_id=1,
                 car_label="2020 Honda Civic",
-                suggested_actions=["Check oil"],
+                suggested_actions=("Check oil",),
                 priority="urgent",  # type: ignore
                 reasoning="Test",
-            )
-        assert "priority" in str(exc_info.value)
+            ),
+            _RE_PRIORITY,
+        )
 
 
 class TestTrackPrepChecklist:
@@ -330,40 +384,31 @@ class TestTrackPrepChecklist:
     def test_valid_checklist(self):
         """Test creating a valid track prep checklist."""
         checklist = TrackPrepChecklist(
-            car_label="2020 Porsche 911 GT3",
-            critical_items=["Check brake pads", "Inspect brake fluid"],
-            recommended_items=["Set tire pressures", "Torque wheel nuts"],
+            car_label=_PORSCHE_LABEL,
+            critical_items=_CRITICAL,
+            recommended_items=_RECOMMENDED,
             notes="Brakes serviced 30 days ago",
         )
-        assert checklist.car_label == "2020 Porsche 911 GT3"
-        assert len(checklist.critical_items) == 2
-        assert len(checklist.recommended_items) == 2
+        assert checklist.car_label == _PORSCHE_LABEL
+        assert tuple(checklist.critical_items) == _CRITICAL
+        assert tuple(checklist.recommended_items) == _RECOMMENDED
         assert checklist.notes == "Brakes serviced 30 days ago"
 
     def test_checklist_without_notes(self):
         """Test creating a checklist without optional notes."""
         checklist = TrackPrepChecklist(
-            car_label="2020 Porsche 911 GT3",
-            critical_items=["Check brake pads"],
-            recommended_items=["Set tire pressures"],
+            car_label=_PORSCHE_LABEL,
+            critical_items=("Check brake pads",),
+            recommended_items=("Set tire pressures",),
         )
         assert checklist.notes is None
 
-    def test_missing_required_fields(self):
-        """Test that missing required fields raise ValidationError."""
-        with pytest.raises(ValidationError) as exc_info:
-            TrackPrepChecklist(car_label="2020 Porsche 911 GT3")
-        errors = exc_info.value.errors()
-        field_names = [e["loc"][0] for e in errors]
-        assert "critical_items" in field_names
-        assert "recommended_items" in field_names
-
     def test_empty_lists_allowed(self):
         """Test that empty lists are valid for item fields."""
         checklist = TrackPrepChecklist(
             car_label="2020 Honda Civic",
-            critical_items=[],
-            recommended_items=[],
+            critical_items=(),
+            recommended_items=(),
         )
         assert checklist.critical_items == []
         assert checklist.recommended_items == []